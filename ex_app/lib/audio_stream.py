@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 from typing import Optional
 
 from aiortc.mediastreams import MediaStreamTrack
@@ -74,7 +75,6 @@ class AudioStream:
                     except asyncio.QueueFull:
                         self._dropped_frames += 1
                         # Only log every 5 seconds to avoid spam
-                        import time
                         now = time.time()
                         if now - self._last_drop_log >= 5.0:
                             logger.warning(
@@ -57,7 +57,7 @@ class Target(BaseModel):
     pass
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Transcript:
     """A transcription result to be sent to participants."""
 
@@ -349,4 +349,5 @@ async def status():
 
 
 if __name__ == "__main__":
+    # uvicorn's default loop="auto" runs on uvloop when it is installed
     run_app(app, log_level="info")
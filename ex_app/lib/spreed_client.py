@@ -2,12 +2,13 @@
 
 import asyncio
 import dataclasses
+import functools
 import gc
 import json
 import logging
+import re
 import threading
 from collections.abc import Awaitable, Callable
-from contextlib import suppress
 from secrets import token_urlsafe
 from urllib.parse import urlparse
 
@@ -26,6 +27,7 @@ from .constants import (
     HPB_PING_TIMEOUT,
     LT_HPB_URL,
     LT_INTERNAL_SECRET,
+    MIN_TRANSCRIPT_SEND_INTERVAL,
 )
 from .livetypes import (
     CallFlag,
@@ -39,15 +41,68 @@ from .livetypes import (
 )
 from .models import LANGUAGE_MAP
 from .transcriber import ModalTranscriber
-from .utils import get_ssl_context, hmac_sha256, sanitize_websocket_url
+from .utils import (
+    RoomTokenFilter,
+    get_ssl_context,
+    hmac_sha256,
+    room_token_var,
+    sanitize_websocket_url,
+)
+
+# Prefer orjson for decoding signaling messages when it is available
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 logger = logging.getLogger(__name__)
+logger.addFilter(RoomTokenFilter())
 
 # Timeout for receiving messages during connection
 MSG_RECEIVE_TIMEOUT = 30
 
+# Maximum number of queued transcripts sent in one consumer pass
+TRANSCRIPT_BATCH_SIZE = 16
+
+# Plain-int call flags for the participants update loop
+_CF_DISCONNECTED = CallFlag.DISCONNECTED.value
+_CF_IN_CALL = CallFlag.IN_CALL.value
+_CF_WITH_AUDIO = CallFlag.WITH_AUDIO.value
+
+# Transcript message envelope around a pre-encoded "data" payload
+_TRANSCRIPT_FRAME = (
+    '{"type": "message", "message": {"recipient": {"type": "session", '
+    '"sessionid": %s}, "data": %s}, "id": "%d"}'
+)
+
+# ICE candidate lines of a local SDP description
+_CANDIDATE_RE = re.compile(r"^a=candidate:[^\r\n]*", re.MULTILINE)
+
+
+def coalesce_transcripts(transcripts: list[Transcript]) -> list[Transcript]:
+    """Drop partial transcripts superseded by a later one from the same speaker.
+
+    Partial transcripts carry the whole accumulated utterance, so only the
+    newest one per speaker is worth sending. Final transcripts are always kept.
+
+    Args:
+        transcripts: Transcripts in queue order
 
-@dataclasses.dataclass
+    Returns:
+        Transcripts to send, in queue order
+    """
+    seen_speakers: set[str] = set()
+    kept: list[Transcript] = []
+    for transcript in reversed(transcripts):
+        if not transcript.final and transcript.speaker_session_id in seen_speakers:
+            continue
+        seen_speakers.add(transcript.speaker_session_id)
+        kept.append(transcript)
+    kept.reverse()
+    return kept
+
+
+@dataclasses.dataclass(slots=True)
 class PeerConnection:
     """Wrapper for RTCPeerConnection with session ID."""
 
@@ -82,6 +137,8 @@ class SpreedClient:
         self.target_lock = asyncio.Lock()
         self.nc_sid_map: dict[str, str] = {}
         self._nc_sid_wait_stash: dict[str, None] = {}
+        self._in_call_sids: set[str] = set()
+        self._users_in_call_state: dict[str, int] = {}
         self.transcript_queue: asyncio.Queue[Transcript] = asyncio.Queue()
         self._transcript_sender: asyncio.Task | None = None
         self.transcribers: dict[str, ModalTranscriber] = {}
@@ -89,8 +146,13 @@ class SpreedClient:
         self._result_consumer_tasks: dict[str, asyncio.Task] = {}
         self._audio_streams: dict[str, AudioStream] = {}
         self.defunct = threading.Event()
+        # Mirrors ``not defunct`` so the transcript consumer can await reactivation
+        self._active_event = asyncio.Event()
+        self._active_event.set()
         self._close_task: asyncio.Task | None = None
         self._deferred_close_task: asyncio.Task | None = None
+        self._deferred_close_deadline: float | None = None
+        self._deferred_close_event = asyncio.Event()
         self._reconnect_task: asyncio.Task | None = None
 
         self.resumeid: str | None = None
@@ -105,9 +167,30 @@ class SpreedClient:
         self.secret = LT_INTERNAL_SECRET
 
         self.room_token = room_token
+        room_token_var.set(room_token)
         self.hpb_settings = hpb_settings
         self.lang_id = lang_id
         self.leave_call_cb = leave_call_cb
+        self._rtc_config = self._build_rtc_config()
+
+    def _build_rtc_config(self) -> RTCConfiguration:
+        """Build the ICE server configuration shared by all peer connections.
+
+        Returns:
+            RTCConfiguration with the STUN/TURN servers from the HPB settings
+        """
+        ice_servers = []
+        for stunserver in self.hpb_settings.stunservers:
+            ice_servers.append(RTCIceServer(urls=stunserver.urls))
+        for turnserver in self.hpb_settings.turnservers:
+            ice_servers.append(
+                RTCIceServer(
+                    urls=turnserver.urls,
+                    username=turnserver.username,
+                    credential=turnserver.credential,
+                )
+            )
+        return RTCConfiguration(iceServers=ice_servers or None)
 
     async def _resume_connection(self) -> bool:
         """Attempt to resume an existing HPB session.
@@ -132,7 +215,6 @@ class SpreedClient:
             logger.exception(
                 "Error resuming connection to HPB with short hello",
                 exc_info=e,
-                extra={"room_token": self.room_token},
             )
             return False
 
@@ -143,7 +225,6 @@ class SpreedClient:
                 logger.error(
                     "No message received for %s secs while resuming, aborting...",
                     MSG_RECEIVE_TIMEOUT,
-                    extra={"room_token": self.room_token},
                 )
                 return False
 
@@ -154,7 +235,6 @@ class SpreedClient:
                     extra={
                         "sessionid": self.sessionid,
                         "resumeid": self.resumeid,
-                        "room_token": self.room_token,
                     },
                 )
                 return True
@@ -163,7 +243,6 @@ class SpreedClient:
                 logger.error(
                     "Signaling error message received during a short resume",
                     extra={
-                        "room_token": self.room_token,
                         "msg_counter": msg_counter,
                         "error_received": message,
                     },
@@ -173,14 +252,12 @@ class SpreedClient:
                 if err_code == "no_such_session":
                     logger.info(
                         "Performing a full reconnect since the previous session expired",
-                        extra={"room_token": self.room_token},
                     )
                     return False
 
                 if err_code == "too_many_requests":
                     logger.error(
                         "Rate limited by the HPB during short resume, giving up",
-                        extra={"room_token": self.room_token},
                     )
                     raise SpreedRateLimitedException()
 
@@ -201,6 +278,7 @@ class SpreedClient:
         Returns:
             Connection result status
         """
+        room_token_var.set(self.room_token)
         if (
             self._server
             and self._server.state == WsState.OPEN
@@ -208,7 +286,7 @@ class SpreedClient:
         ):
             logger.debug(
                 "Already connected to signaling server, skipping connect",
-                extra={"room_token": self.room_token, "reconnect": reconnect},
+                extra={"reconnect": reconnect},
             )
             return SigConnectResult.SUCCESS
 
@@ -231,7 +309,7 @@ class SpreedClient:
             logger.exception(
                 "Error connecting to signaling server, retrying...",
                 exc_info=e,
-                extra={"room_token": self.room_token, "reconnect": reconnect},
+                extra={"reconnect": reconnect},
             )
             if reconnect != ReconnectMethod.NO_RECONNECT:
                 await asyncio.sleep(2)
@@ -245,14 +323,12 @@ class SpreedClient:
             try:
                 res = await self._resume_connection()
             except SpreedRateLimitedException:
-                if not self._close_task:
-                    self._close_task = asyncio.create_task(self.close())
+                self._request_close()
                 return SigConnectResult.FAILURE
             except Exception as e:
                 logger.exception(
                     "Unexpected error during short resume, retrying connection",
                     exc_info=e,
-                    extra={"room_token": self.room_token},
                 )
                 if reconnect != ReconnectMethod.NO_RECONNECT:
                     self._reconnect_task = asyncio.create_task(
@@ -264,7 +340,6 @@ class SpreedClient:
                 logger.info(
                     "Resumed connection to signaling server for room token: %s",
                     self.room_token,
-                    extra={"room_token": self.room_token},
                 )
                 await self.send_incall()
                 await self.send_join()
@@ -273,7 +348,6 @@ class SpreedClient:
             logger.info(
                 "Short resume failed, performing full reconnect for room token: %s",
                 self.room_token,
-                extra={"room_token": self.room_token},
             )
             if reconnect != ReconnectMethod.NO_RECONNECT:
                 await asyncio.sleep(2)
@@ -287,18 +361,20 @@ class SpreedClient:
             logger.info(
                 "Performing full reconnect for room token: %s",
                 self.room_token,
-                extra={"room_token": self.room_token},
             )
             try:
                 await asyncio.wait_for(self.close(), CALL_LEAVE_TIMEOUT)
             except TimeoutError:
                 logger.warning(
                     "Timeout while closing SpreedClient during full reconnect",
-                    extra={"room_token": self.room_token},
                 )
             finally:
                 self.defunct.set()
+                self._active_event.clear()
+                if self._deferred_close_task and not self._deferred_close_task.done():
+                    self._deferred_close_task.cancel()
                 self._deferred_close_task = None
+                self._deferred_close_deadline = None
                 self._monitor = None
                 self.resumeid = None
                 self.sessionid = None
@@ -313,7 +389,7 @@ class SpreedClient:
                 logger.error(
                     "No message received for %s secs, aborting...",
                     MSG_RECEIVE_TIMEOUT,
-                    extra={"room_token": self.room_token, "msg_counter": msg_counter},
+                    extra={"msg_counter": msg_counter},
                 )
                 return SigConnectResult.FAILURE
 
@@ -322,21 +398,15 @@ class SpreedClient:
                     "Signaling error message received: %s\nDetails: %s",
                     message.get("error", {}).get("message"),
                     message.get("error", {}).get("details"),
-                    extra={"room_token": self.room_token, "msg_counter": msg_counter},
+                    extra={"msg_counter": msg_counter},
                 )
 
                 message_code = message.get("error", {}).get("code")
                 if message_code == "duplicate_session":
-                    logger.error(
-                        "Duplicate session found, aborting connection",
-                        extra={"room_token": self.room_token},
-                    )
+                    logger.error("Duplicate session found, aborting connection")
                     return SigConnectResult.FAILURE
                 if message_code == "room_join_failed":
-                    logger.error(
-                        "Room join failed, retrying...",
-                        extra={"room_token": self.room_token},
-                    )
+                    logger.error("Room join failed, retrying...")
                     if reconnect != ReconnectMethod.NO_RECONNECT:
                         await asyncio.sleep(2)
                         self._reconnect_task = asyncio.create_task(
@@ -347,17 +417,11 @@ class SpreedClient:
                 return SigConnectResult.FAILURE
 
             if message.get("type") == "bye":
-                logger.info(
-                    "Received bye message, closing connection",
-                    extra={"room_token": self.room_token},
-                )
+                logger.info("Received bye message, closing connection")
                 return SigConnectResult.FAILURE
 
             if message.get("type") == "welcome":
-                logger.debug(
-                    "Welcome message received",
-                    extra={"room_token": self.room_token},
-                )
+                logger.debug("Welcome message received")
                 continue
 
             if message.get("type") == "hello":
@@ -368,7 +432,6 @@ class SpreedClient:
                     extra={
                         "sessionid": self.sessionid,
                         "resumeid": self.resumeid,
-                        "room_token": self.room_token,
                     },
                 )
                 break
@@ -377,7 +440,6 @@ class SpreedClient:
             if msg_counter > 10:
                 logger.error(
                     "Too many messages received without 'welcome', reconnecting...",
-                    extra={"room_token": self.room_token},
                 )
                 if reconnect != ReconnectMethod.NO_RECONNECT:
                     await asyncio.sleep(2)
@@ -387,6 +449,7 @@ class SpreedClient:
                 return SigConnectResult.RETRY
 
         self.defunct.clear()
+        self._active_event.set()
         self._monitor = asyncio.create_task(self.signalling_monitor())
 
         if self._transcript_sender is None or self._transcript_sender.done():
@@ -394,17 +457,24 @@ class SpreedClient:
                 self.transcript_queue_consumer()
             )
 
+        if self._deferred_close_task is None or self._deferred_close_task.done():
+            self._deferred_close_task = asyncio.create_task(
+                self._deferred_close_worker()
+            )
+
         if reconnect == ReconnectMethod.NO_RECONNECT:
-            self._deferred_close_task = asyncio.create_task(self.maybe_leave_call())
+            self._schedule_deferred_close()
 
         await self.send_incall()
         await self.send_join()
-        logger.info(
-            "Connected to signaling server",
-            extra={"room_token": self.room_token},
-        )
+        logger.info("Connected to signaling server")
         return SigConnectResult.SUCCESS
 
+    def _request_close(self) -> None:
+        """Schedule close() in the background, at most once per client."""
+        if self._close_task is None:
+            self._close_task = asyncio.create_task(self.close())
+
     async def send_message(self, message: dict) -> None:
         """Send a message to HPB.
 
@@ -414,19 +484,47 @@ class SpreedClient:
         if not self._server:
             logger.error(
                 "No server connection, cannot send message",
-                extra={"room_token": self.room_token, "send_message": message},
+                extra={"send_message": message},
             )
             return
 
         self.id += 1
         message["id"] = str(self.id)
+        await self._send_frame(json.dumps(message), self.id)
+
+    async def _send_transcript_data(self, session_id: str, data_json: str) -> None:
+        """Send an already JSON-encoded transcript payload to one session.
+
+        Args:
+            session_id: HPB session ID of the recipient
+            data_json: JSON-encoded "data" object of the transcript message
+        """
+        if not self._server:
+            logger.error(
+                "No server connection, cannot send transcript",
+                extra={"session_id": session_id},
+            )
+            return
+
+        self.id += 1
+        await self._send_frame(
+            _TRANSCRIPT_FRAME % (json.dumps(session_id), data_json, self.id),
+            self.id,
+        )
+
+    async def _send_frame(self, frame: str, msg_id: int) -> None:
+        """Write one encoded signaling message to the HPB websocket.
+
+        Args:
+            frame: JSON-encoded message
+            msg_id: ID assigned to the message
+        """
         try:
-            await self._server.send(json.dumps(message))
+            await self._server.send(frame)
         except WebSocketException as e:
             logger.exception(
                 "HPB websocket error, reconnecting...",
                 exc_info=e,
-                extra={"room_token": self.room_token},
             )
             if not self._reconnect_task or self._reconnect_task.done():
                 self._reconnect_task = asyncio.create_task(
@@ -437,14 +535,14 @@ class SpreedClient:
             logger.exception(
                 "Unexpected error sending message to HPB, ignoring",
                 exc_info=e,
-                extra={"room_token": self.room_token},
             )
             return
 
-        logger.debug(
-            "Message sent",
-            extra={"id": self.id, "room_token": self.room_token},
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Message sent",
+                extra={"id": msg_id},
+            )
 
     async def send_hello(self) -> None:
         """Send hello message to authenticate with HPB."""
@@ -586,12 +684,20 @@ class SpreedClient:
         Args:
             transcript: Transcript to send
         """
+        await self.send_transcripts([transcript])
+
+    async def send_transcripts(self, transcripts: list[Transcript]) -> None:
+        """Send a batch of transcripts to all targets.
+
+        The target list is snapshotted once for the whole batch and all
+        messages are written concurrently.
+
+        Args:
+            transcripts: Transcripts to send, in order
+        """
         async with self.target_lock:
             if not self.targets:
-                logger.debug(
-                    "No targets to send transcript to, skipping",
-                    extra={"room_token": self.room_token},
-                )
+                logger.debug("No targets to send transcript to, skipping")
                 return
             sids = list(self.targets.keys())
             nc_sid_map = dict(self.nc_sid_map)
@@ -599,136 +705,150 @@ class SpreedClient:
         nc_targets = [
             nc_sid for nc_sid, session_id in nc_sid_map.items() if session_id in sids
         ]
-        preview = transcript.message if len(transcript.message) < 200 else transcript.message[:197] + "..."
-        logger.info(
-            "Sending transcript",
-            extra={
-                "room_token": self.room_token,
-                "speaker_session_id": transcript.speaker_session_id,
-                "final": transcript.final,
-                "targets": sids,
-                "targets_nc": nc_targets,
-                "lang_id": transcript.lang_id,
-                "preview": preview,
-            },
-        )
-
-        send_tasks = [
-            self.send_message(
+        send_tasks = []
+        for transcript in transcripts:
+            preview = transcript.message if len(transcript.message) < 200 else transcript.message[:197] + "..."
+            logger.info(
+                "Sending transcript",
+                extra={
+                    "speaker_session_id": transcript.speaker_session_id,
+                    "final": transcript.final,
+                    "targets": sids,
+                    "targets_nc": nc_targets,
+                    "lang_id": transcript.lang_id,
+                    "preview": preview,
+                },
+            )
+            # Encode the payload once and reuse it for every recipient
+            data_json = json.dumps(
                 {
-                    "type": "message",
-                    "message": {
-                        "recipient": {
-                            "type": "session",
-                            "sessionid": sid,
-                        },
-                        "data": {
-                            "final": transcript.final,
-                            "langId": transcript.lang_id,
-                            "message": transcript.message,
-                            "speakerSessionId": transcript.speaker_session_id,
-                            "type": "transcript",
-                        },
-                    },
+                    "final": transcript.final,
+                    "langId": transcript.lang_id,
+                    "message": transcript.message,
+                    "speakerSessionId": transcript.speaker_session_id,
+                    "type": "transcript",
                 }
             )
-            for sid in sids
-        ]
+            send_tasks.extend(
+                self._send_transcript_data(sid, data_json) for sid in sids
+            )
         await asyncio.gather(*send_tasks)
 
     async def close(self) -> None:
         """Close the client and clean up resources."""
+        room_token_var.set(self.room_token)
         if self.defunct.is_set():
-            logger.debug(
-                "SpreedClient is already defunct, skipping close",
-                extra={"room_token": self.room_token},
-            )
+            logger.debug("SpreedClient is already defunct, skipping close")
             return
 
+        self._deferred_close_deadline = None
         if self._deferred_close_task and not self._deferred_close_task.done():
-            logger.debug(
-                "Cancelling deferred close task",
-                extra={"room_token": self.room_token},
-            )
+            logger.debug("Cancelling deferred close task")
             self._deferred_close_task.cancel()
             self._deferred_close_task = None
 
         if self._reconnect_task and not self._reconnect_task.done():
-            logger.debug(
-                "Cancelling reconnect task",
-                extra={"room_token": self.room_token},
-            )
+            logger.debug("Cancelling reconnect task")
             self._reconnect_task.cancel()
             self._reconnect_task = None
 
         app_closing = self._monitor.cancelled() if self._monitor else False
 
-        with suppress(Exception):
+        try:
             if self._monitor and not self._monitor.done():
-                logger.debug(
-                    "Cancelling monitor task",
-                    extra={"room_token": self.room_token},
-                )
+                logger.debug("Cancelling monitor task")
                 self._monitor.cancel()
             self._monitor = None
+        except Exception:
+            logger.debug(
+                "Error cancelling monitor task",
+                exc_info=True,
+            )
 
-        with suppress(Exception):
+        try:
             await self.send_bye()
-
-        with suppress(Exception):
+        except Exception:
             logger.debug(
-                "Cancelling result consumer tasks",
-                extra={"room_token": self.room_token},
+                "Error sending bye message",
+                exc_info=True,
             )
+
+        try:
+            logger.debug("Cancelling result consumer tasks")
             for task in self._result_consumer_tasks.values():
                 if not task.done():
                     task.cancel()
             self._result_consumer_tasks.clear()
-
-        with suppress(Exception):
+        except Exception:
             logger.debug(
-                "Stopping audio streams",
-                extra={"room_token": self.room_token},
+                "Error cancelling result consumer tasks",
+                exc_info=True,
             )
+
+        try:
+            logger.debug("Stopping audio streams")
             for stream in self._audio_streams.values():
                 await stream.stop()
             self._audio_streams.clear()
-
-        with suppress(Exception):
+        except Exception:
             logger.debug(
-                "Shutting down all transcribers",
-                extra={"room_token": self.room_token},
+                "Error stopping audio streams",
+                exc_info=True,
             )
+
+        try:
+            logger.debug("Shutting down all transcribers")
             for transcriber in self.transcribers.values():
                 await transcriber.stop()
             async with self.transcriber_lock:
                 self.transcribers.clear()
+        except Exception:
+            logger.debug(
+                "Error shutting down transcribers",
+                exc_info=True,
+            )
 
-        with suppress(Exception):
+        try:
             for pc in self.peer_connections.values():
                 if pc.pc.connectionState not in ("closed", "failed"):
                     logger.debug(
                         "Closing peer connection",
                         extra={
                             "session_id": pc.session_id,
-                            "room_token": self.room_token,
                         },
                     )
-                    with suppress(Exception):
+                    try:
                         await pc.pc.close()
+                    except Exception:
+                        logger.debug(
+                            "Error closing peer connection",
+                            exc_info=True,
+                            extra={
+                                "session_id": pc.session_id,
+                            },
+                        )
             async with self.peer_connection_lock:
                 self.peer_connections.clear()
+            self._in_call_sids.clear()
+            self._users_in_call_state.clear()
             self.resumeid = None
             self.sessionid = None
+        except Exception:
+            logger.debug(
+                "Error closing peer connections",
+                exc_info=True,
+            )
 
-        with suppress(Exception):
+        try:
             if self._transcript_sender and not self._transcript_sender.done():
-                logger.debug(
-                    "Cancelling transcript sender task",
-                    extra={"room_token": self.room_token},
-                )
+                logger.debug("Cancelling transcript sender task")
                 self._transcript_sender.cancel()
                 self._transcript_sender = None
+        except Exception:
+            logger.debug(
+                "Error cancelling transcript sender task",
+                exc_info=True,
+            )
 
         # Clear transcript queue to release memory
         while not self.transcript_queue.empty():
@@ -737,16 +857,19 @@ class SpreedClient:
             except asyncio.QueueEmpty:
                 break
 
-        with suppress(Exception):
+        try:
             if self._server and self._server.state == WsState.OPEN:
-                logger.debug(
-                    "Closing WebSocket connection",
-                    extra={"room_token": self.room_token},
-                )
+                logger.debug("Closing WebSocket connection")
                 await self._server.close()
             self._server = None
+        except Exception:
+            logger.debug(
+                "Error closing WebSocket connection",
+                exc_info=True,
+            )
 
         self.defunct.set()
+        self._active_event.clear()
 
         # Force garbage collection to release memory from aiortc/numpy
         gc.collect()
@@ -764,10 +887,7 @@ class SpreedClient:
             Parsed message or None
         """
         if not self._server:
-            logger.debug(
-                "No server connection, cannot receive message",
-                extra={"room_token": self.room_token},
-            )
+            logger.debug("No server connection, cannot receive message")
             return None
 
         if timeout > 0:
@@ -775,11 +895,12 @@ class SpreedClient:
         else:
             received_msg = await self._server.recv()
 
-        message = json.loads(received_msg)
-        logger.debug(
-            "Message received",
-            extra={"recv_message": message, "room_token": self.room_token},
-        )
+        message = json_loads(received_msg)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Message received",
+                extra={"recv_message": message},
+            )
         return message
 
     async def add_target(self, nc_session_id: str) -> None:
@@ -788,33 +909,38 @@ class SpreedClient:
         Args:
             nc_session_id: Nextcloud session ID
         """
+        room_token_var.set(self.room_token)
         async with self.target_lock:
-            if nc_session_id not in self.nc_sid_map:
-                self._nc_sid_wait_stash[nc_session_id] = None
-                logger.debug(
-                    "HPB session ID not found, deferring add",
-                    extra={
-                        "nc_session_id": nc_session_id,
-                        "room_token": self.room_token,
-                    },
-                )
-                return
+            self._add_target_locked(nc_session_id)
 
-            self._nc_sid_wait_stash.pop(nc_session_id, None)
-            session_id = self.nc_sid_map[nc_session_id]
-            if session_id not in self.targets:
-                self.targets[session_id] = Target()
-                logger.debug(
-                    "Added target",
-                    extra={
-                        "session_id": session_id,
-                        "nc_session_id": nc_session_id,
-                        "room_token": self.room_token,
-                    },
-                )
-            if self._deferred_close_task:
-                self._deferred_close_task.cancel()
-                self._deferred_close_task = None
+    def _add_target_locked(self, nc_session_id: str) -> None:
+        """Add a target, with target_lock already held.
+
+        Args:
+            nc_session_id: Nextcloud session ID
+        """
+        if nc_session_id not in self.nc_sid_map:
+            self._nc_sid_wait_stash[nc_session_id] = None
+            logger.debug(
+                "HPB session ID not found, deferring add",
+                extra={
+                    "nc_session_id": nc_session_id,
+                },
+            )
+            return
+
+        self._nc_sid_wait_stash.pop(nc_session_id, None)
+        session_id = self.nc_sid_map[nc_session_id]
+        if session_id not in self.targets:
+            self.targets[session_id] = Target()
+            logger.debug(
+                "Added target",
+                extra={
+                    "session_id": session_id,
+                    "nc_session_id": nc_session_id,
+                },
+            )
+        self._cancel_deferred_close()
 
     async def remove_target(self, nc_session_id: str) -> None:
         """Remove a target.
@@ -822,6 +948,7 @@ class SpreedClient:
         Args:
             nc_session_id: Nextcloud session ID
         """
+        room_token_var.set(self.room_token)
         async with self.target_lock:
             self._nc_sid_wait_stash.pop(nc_session_id, None)
             if nc_session_id not in self.nc_sid_map:
@@ -829,7 +956,6 @@ class SpreedClient:
                     "HPB session ID not found",
                     extra={
                         "nc_session_id": nc_session_id,
-                        "room_token": self.room_token,
                     },
                 )
                 return
@@ -841,16 +967,11 @@ class SpreedClient:
                     extra={
                         "session_id": session_id,
                         "nc_session_id": nc_session_id,
-                        "room_token": self.room_token,
                     },
                 )
                 del self.targets[session_id]
                 if len(self.targets) == 0:
-                    if self._deferred_close_task:
-                        self._deferred_close_task.cancel()
-                    self._deferred_close_task = asyncio.create_task(
-                        self.maybe_leave_call()
-                    )
+                    self._schedule_deferred_close()
 
     async def remove_target_hpb_sid(self, session_id: str) -> None:
         """Remove a target by HPB session ID.
@@ -859,32 +980,36 @@ class SpreedClient:
             session_id: HPB session ID
         """
         async with self.target_lock:
-            if session_id in self.targets:
-                logger.debug(
-                    "Removed target by HPB SID",
-                    extra={
-                        "session_id": session_id,
-                        "room_token": self.room_token,
-                    },
-                )
-                del self.targets[session_id]
-                if len(self.targets) == 0:
-                    if self._deferred_close_task:
-                        self._deferred_close_task.cancel()
-                    self._deferred_close_task = asyncio.create_task(
-                        self.maybe_leave_call()
-                    )
+            self._remove_target_hpb_sid_locked(session_id)
+
+    def _remove_target_hpb_sid_locked(self, session_id: str) -> None:
+        """Remove a target by HPB session ID, with target_lock already held.
+
+        Args:
+            session_id: HPB session ID
+        """
+        if session_id in self.targets:
+            logger.debug(
+                "Removed target by HPB SID",
+                extra={
+                    "session_id": session_id,
+                },
+            )
+            del self.targets[session_id]
+            if len(self.targets) == 0:
+                self._schedule_deferred_close()
 
     async def signalling_monitor(self) -> None:
         """Monitor the signaling server for incoming messages."""
+        # Bind the receive method once; this loop runs for the whole call
+        receive = self.receive
         while True:
             try:
-                message = await self.receive()
+                message = await receive()
             except WebSocketException as e:
                 logger.exception(
                     "HPB websocket error, reconnecting...",
                     exc_info=e,
-                    extra={"room_token": self.room_token},
                 )
                 if not self._reconnect_task or self._reconnect_task.done():
                     self._reconnect_task = asyncio.create_task(
@@ -893,21 +1018,15 @@ class SpreedClient:
                 await asyncio.sleep(2)
                 continue
             except asyncio.CancelledError:
-                logger.debug(
-                    "Signalling monitor task cancelled",
-                    extra={"room_token": self.room_token},
-                )
-                if not self._close_task:
-                    self._close_task = asyncio.create_task(self.close())
+                logger.debug("Signalling monitor task cancelled")
+                self._request_close()
                 raise
             except Exception as e:
                 logger.exception(
                     "Unexpected error in signalling monitor",
                     exc_info=e,
-                    extra={"room_token": self.room_token},
                 )
-                if not self._close_task:
-                    self._close_task = asyncio.create_task(self.close())
+                self._request_close()
                 break
 
             if message is None:
@@ -916,32 +1035,27 @@ class SpreedClient:
             msg_type = message.get("type")
 
             if msg_type == "error":
+                error = message.get("error", {})
                 logger.error(
                     "Error message received: %s",
-                    message.get("error", {}).get("message"),
-                    extra={"room_token": self.room_token, "recv_message": message},
+                    error.get("message"),
+                    extra={"recv_message": message},
                 )
-                if message.get("error", {}).get("code") == "processing_failed":
+                if error.get("code") == "processing_failed":
                     continue
-                if not self._close_task:
-                    self._close_task = asyncio.create_task(self.close())
+                self._request_close()
                 return
 
-            if (
-                msg_type == "event"
-                and message["event"]["target"] == "participants"
-                and message["event"]["type"] == "update"
-            ):
-                await self._handle_participants_update(message)
-                continue
+            if msg_type == "event":
+                event = message["event"]
+                if event["target"] == "participants" and event["type"] == "update":
+                    await self._handle_participants_update(message)
+                    continue
 
             if msg_type == "message":
                 data_type = message.get("message", {}).get("data", {}).get("type")
                 if data_type == "offer":
-                    logger.debug(
-                        "Received offer message",
-                        extra={"room_token": self.room_token},
-                    )
+                    logger.debug("Received offer message")
                     await self.handle_offer(message)
                     continue
                 if data_type == "candidate":
@@ -949,12 +1063,8 @@ class SpreedClient:
                     continue
 
             if msg_type == "bye":
-                logger.debug(
-                    "Received bye message, closing connection",
-                    extra={"room_token": self.room_token},
-                )
-                if not self._close_task:
-                    self._close_task = asyncio.create_task(self.close())
+                logger.debug("Received bye message, closing connection")
+                self._request_close()
 
     async def _handle_participants_update(self, message: dict) -> None:
         """Handle participants update event.
@@ -962,115 +1072,125 @@ class SpreedClient:
         Args:
             message: Update message from HPB
         """
-        logger.debug(
-            "Participants update received",
-            extra={"room_token": self.room_token},
-        )
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Participants update received")
 
         update = message["event"]["update"]
         if update.get("all") and update.get("incall") == 0:
-            logger.debug(
-                "Call ended for everyone, closing connection",
-                extra={"room_token": self.room_token},
-            )
-            if not self._close_task:
-                self._close_task = asyncio.create_task(self.close())
+            logger.debug("Call ended for everyone, closing connection")
+            self._request_close()
             return
 
         users_update = update.get("users", [])
         if not users_update:
             return
 
+        # First pass: classify participants without holding any lock
+        disconnected: list[tuple[str, str | None]] = []
+        joined: list[tuple[str, str]] = []
+        with_audio: list[str] = []
+        someone_left = False
         for user_desc in users_update:
+            in_call = user_desc.get("inCall", _CF_DISCONNECTED)
+            sid = user_desc.get("sessionId")
+            wants_offer = (
+                in_call & _CF_IN_CALL
+                and in_call & _CF_WITH_AUDIO
+                and sid not in self.peer_connections
+            )
+            if self._users_in_call_state.get(sid) == in_call and not wants_offer:
+                # HPB resends the whole list; skip participants that did not change
+                continue
+            if in_call == _CF_DISCONNECTED:
+                self._users_in_call_state.pop(sid, None)
+            else:
+                self._users_in_call_state[sid] = in_call
+
+            if in_call & _CF_IN_CALL:
+                self._in_call_sids.add(sid)
+            else:
+                self._in_call_sids.discard(sid)
+                if sid != self.sessionid:
+                    someone_left = True
+
             if user_desc.get("internal", False):
                 continue
 
-            if user_desc["inCall"] == CallFlag.DISCONNECTED:
-                logger.debug(
-                    "User disconnected",
-                    extra={
-                        "user_desc": user_desc,
-                        "room_token": self.room_token,
-                    },
-                )
-                async with self.transcriber_lock:
-                    if user_desc["sessionId"] in self.transcribers:
-                        await self.transcribers[user_desc["sessionId"]].stop()
-                        del self.transcribers[user_desc["sessionId"]]
-                await self.remove_target_hpb_sid(user_desc["sessionId"])
-                async with self.target_lock:
-                    self.nc_sid_map.pop(
-                        user_desc.get("nextcloudSessionId", ""), None
+            nc_sid = user_desc.get("nextcloudSessionId")
+            if in_call == _CF_DISCONNECTED:
+                if debug:
+                    logger.debug(
+                        "User disconnected",
+                        extra={
+                            "user_desc": user_desc,
+                        },
                     )
+                disconnected.append((sid, nc_sid))
                 continue
 
-            async with self.target_lock:
-                if "nextcloudSessionId" in user_desc:
-                    self.nc_sid_map[user_desc["nextcloudSessionId"]] = user_desc[
-                        "sessionId"
-                    ]
-
-            if user_desc.get("nextcloudSessionId") in self._nc_sid_wait_stash:
-                logger.debug(
-                    "Adding deferred target",
-                    extra={
-                        "nc_session_id": user_desc["nextcloudSessionId"],
-                        "room_token": self.room_token,
-                    },
-                )
-                await self.add_target(user_desc["nextcloudSessionId"])
-                async with self.target_lock:
-                    self._nc_sid_wait_stash.pop(
-                        user_desc["nextcloudSessionId"], None
+            if nc_sid is not None:
+                joined.append((sid, nc_sid))
+            if in_call & _CF_IN_CALL and in_call & _CF_WITH_AUDIO:
+                if debug:
+                    logger.debug(
+                        "User joined with audio",
+                        extra={
+                            "user_desc": user_desc,
+                        },
                     )
+                with_audio.append(sid)
 
-            if user_desc["inCall"] & CallFlag.IN_CALL and user_desc[
-                "inCall"
-            ] & CallFlag.WITH_AUDIO:
-                logger.debug(
-                    "User joined with audio",
-                    extra={
-                        "user_desc": user_desc,
-                        "room_token": self.room_token,
-                    },
-                )
-                async with self.peer_connection_lock:
+        # Second pass: apply all state changes with one acquire per lock
+        if disconnected:
+            async with self.transcriber_lock:
+                for sid, _ in disconnected:
+                    self._audio_streams.pop(sid, None)
+                    transcriber = self.transcribers.pop(sid, None)
+                    if transcriber is not None:
+                        await transcriber.stop()
+
+        if disconnected or joined:
+            async with self.target_lock:
+                for sid, nc_sid in disconnected:
+                    self._remove_target_hpb_sid_locked(sid)
+                    self.nc_sid_map.pop(nc_sid or "", None)
+                for sid, nc_sid in joined:
+                    self.nc_sid_map[nc_sid] = sid
+                    if nc_sid in self._nc_sid_wait_stash:
+                        logger.debug(
+                            "Adding deferred target",
+                            extra={
+                                "nc_session_id": nc_sid,
+                            },
+                        )
+                        self._add_target_locked(nc_sid)
+
+        to_offer: list[str] = []
+        if with_audio:
+            async with self.peer_connection_lock:
+                for sid in with_audio:
+                    peer_connection = self.peer_connections.get(sid)
                     if (
-                        user_desc["sessionId"] in self.peer_connections
-                        and self.peer_connections[
-                            user_desc["sessionId"]
-                        ].pc.connectionState
+                        peer_connection is not None
+                        and peer_connection.pc.connectionState
                         not in ("closed", "failed")
                     ):
                         logger.debug(
                             "Peer connection already exists, skipping offer request",
-                            extra={"room_token": self.room_token},
                         )
                         continue
-                await self.send_offer_request(user_desc["sessionId"])
+                    to_offer.append(sid)
+        if to_offer:
+            await asyncio.gather(
+                *(self.send_offer_request(sid) for sid in to_offer),
+                return_exceptions=True,
+            )
 
         # Check if we're the last one in the call
-        if len(users_update) == 2:
-            if (
-                users_update[0].get("sessionId") != self.sessionid
-                and users_update[1].get("sessionId") != self.sessionid
-            ):
-                return
-
-            transcriber_index = (
-                0 if users_update[0].get("sessionId") == self.sessionid else 1
-            )
-            if (
-                users_update[transcriber_index].get("inCall") & CallFlag.IN_CALL
-                and users_update[transcriber_index ^ 1].get("inCall")
-                == CallFlag.DISCONNECTED
-            ):
-                logger.debug(
-                    "Last user left the call, closing connection",
-                    extra={"room_token": self.room_token},
-                )
-                if not self._close_task:
-                    self._close_task = asyncio.create_task(self.close())
+        if someone_left and self._in_call_sids == {self.sessionid}:
+            logger.debug("Last user left the call, closing connection")
+            self._request_close()
 
     async def _handle_candidate(self, message: dict) -> None:
         """Handle ICE candidate message.
@@ -1078,41 +1198,71 @@ class SpreedClient:
         Args:
             message: Candidate message from HPB
         """
-        logger.debug(
-            "Received candidate message",
-            extra={
-                "peer_session_id": message["message"]["sender"]["sessionid"],
-                "room_token": self.room_token,
-            },
-        )
-        candidate = candidate_from_sdp(
-            message["message"]["data"]["payload"]["candidate"]["candidate"]
-        )
-        candidate.sdpMid = message["message"]["data"]["payload"]["candidate"]["sdpMid"]
-        candidate.sdpMLineIndex = message["message"]["data"]["payload"]["candidate"][
-            "sdpMLineIndex"
-        ]
+        inner_msg = message["message"]
+        sender_sid = inner_msg["sender"]["sessionid"]
+        cand = inner_msg["data"]["payload"]["candidate"]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Received candidate message",
+                extra={
+                    "peer_session_id": sender_sid,
+                },
+            )
         async with self.peer_connection_lock:
-            if message["message"]["sender"]["sessionid"] not in self.peer_connections:
+            peer_connection = self.peer_connections.get(sender_sid)
+            if peer_connection is None:
                 return
-            await self.peer_connections[
-                message["message"]["sender"]["sessionid"]
-            ].pc.addIceCandidate(candidate)
+            # Only parse candidates for peers we actually have a connection with
+            candidate = candidate_from_sdp(cand["candidate"])
+            candidate.sdpMid = cand["sdpMid"]
+            candidate.sdpMLineIndex = cand["sdpMLineIndex"]
+            await peer_connection.pc.addIceCandidate(candidate)
+
+    def _schedule_deferred_close(self) -> None:
+        """(Re)arm the deferred close to fire after CALL_LEAVE_TIMEOUT."""
+        logger.debug("Waiting to leave call if there are no targets")
+        loop = asyncio.get_running_loop()
+        self._deferred_close_deadline = loop.time() + CALL_LEAVE_TIMEOUT
+        self._deferred_close_event.set()
+
+    def _cancel_deferred_close(self) -> None:
+        """Disarm a pending deferred close, if any."""
+        if self._deferred_close_deadline is None:
+            return
+        self._deferred_close_deadline = None
+        self._deferred_close_event.set()
+
+    async def _deferred_close_worker(self) -> None:
+        """Wait for the deferred close deadline and leave the call if it expires.
+
+        A single long-lived task serves every target change: re-arming or
+        disarming only moves the deadline and wakes this task up.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            self._deferred_close_event.clear()
+            deadline = self._deferred_close_deadline
+            if deadline is None:
+                await self._deferred_close_event.wait()
+                continue
+
+            remaining = deadline - loop.time()
+            if remaining > 0:
+                try:
+                    await asyncio.wait_for(
+                        self._deferred_close_event.wait(), remaining
+                    )
+                except TimeoutError:
+                    pass
+                continue
+
+            self._deferred_close_deadline = None
+            await self.maybe_leave_call()
 
     async def maybe_leave_call(self) -> None:
         """Leave the call if there are no targets."""
-        logger.debug(
-            "Waiting to leave call if there are no targets",
-            extra={"room_token": self.room_token},
-        )
-        await asyncio.sleep(CALL_LEAVE_TIMEOUT)
-
         if self.defunct.is_set():
-            logger.debug(
-                "SpreedClient is already defunct, clearing deferred close task",
-                extra={"room_token": self.room_token},
-            )
-            self._deferred_close_task = None
+            logger.debug("SpreedClient is already defunct, skipping deferred close")
             return
 
         async with self.target_lock:
@@ -1121,11 +1271,8 @@ class SpreedClient:
             logger.debug(
                 "No transcript receivers for %s secs, leaving the call",
                 CALL_LEAVE_TIMEOUT,
-                extra={"room_token": self.room_token},
             )
-            if not self._close_task:
-                self._close_task = asyncio.create_task(self.close())
-        self._deferred_close_task = None
+            self._request_close()
 
     async def handle_offer(self, message: dict) -> None:
         """Handle incoming WebRTC offer.
@@ -1136,39 +1283,25 @@ class SpreedClient:
         if self.defunct.is_set():
             return
 
-        spkr_sid = message["message"]["sender"]["sessionid"]
+        inner_msg = message["message"]
+        data = inner_msg["data"]
+        spkr_sid = inner_msg["sender"]["sessionid"]
+        offer_sid = data["sid"]
         async with self.peer_connection_lock:
-            if (
-                spkr_sid in self.peer_connections
-                and self.peer_connections[spkr_sid].pc.connectionState
-                not in ("closed", "failed")
+            existing = self.peer_connections.get(spkr_sid)
+            if existing is not None and existing.pc.connectionState not in (
+                "closed",
+                "failed",
             ):
                 logger.debug(
                     "Peer connection already exists, skipping",
                     extra={
                         "session_id": spkr_sid,
-                        "room_token": self.room_token,
                     },
                 )
                 return
 
-        # Build ICE server configuration
-        ice_servers = []
-        for stunserver in self.hpb_settings.stunservers:
-            ice_servers.append(RTCIceServer(urls=stunserver.urls))
-        for turnserver in self.hpb_settings.turnservers:
-            ice_servers.append(
-                RTCIceServer(
-                    urls=turnserver.urls,
-                    username=turnserver.username,
-                    credential=turnserver.credential,
-                )
-            )
-        if len(ice_servers) == 0:
-            ice_servers = None
-
-        rtc_config = RTCConfiguration(iceServers=ice_servers)
-        pc = RTCPeerConnection(configuration=rtc_config)
+        pc = RTCPeerConnection(configuration=self._rtc_config)
 
         @pc.on("connectionstatechange")
         async def on_connectionstatechange():
@@ -1177,7 +1310,6 @@ class SpreedClient:
                 extra={
                     "session_id": spkr_sid,
                     "connection_state": pc.connectionState,
-                    "room_token": self.room_token,
                 },
             )
             if pc.connectionState in ("failed", "closed"):
@@ -1195,7 +1327,6 @@ class SpreedClient:
                     spkr_sid,
                     extra={
                         "session_id": spkr_sid,
-                        "room_token": self.room_token,
                     },
                 )
                 stream = AudioStream(track)
@@ -1217,16 +1348,17 @@ class SpreedClient:
                             self._consume_transcriber_results(transcriber, spkr_sid)
                         )
                         self._result_consumer_tasks[spkr_sid] = task
+                        task.add_done_callback(
+                            functools.partial(self._forget_result_consumer, spkr_sid)
+                        )
                     except Exception:
                         logger.exception(
                             "Error starting transcriber",
                             extra={
                                 "session_id": spkr_sid,
-                                "room_token": self.room_token,
                             },
                         )
-                        if not self._close_task:
-                            self._close_task = asyncio.create_task(self.close())
+                        self._request_close()
                         return
 
                     lang_name = LANGUAGE_MAP.get(self.lang_id)
@@ -1238,7 +1370,6 @@ class SpreedClient:
                         extra={
                             "session_id": spkr_sid,
                             "language": self.lang_id,
-                            "room_token": self.room_token,
                         },
                     )
 
@@ -1248,9 +1379,7 @@ class SpreedClient:
             )
 
         await pc.setRemoteDescription(
-            RTCSessionDescription(
-                type="offer", sdp=message["message"]["data"]["payload"]["sdp"]
-            )
+            RTCSessionDescription(type="offer", sdp=data["payload"]["sdp"])
         )
 
         answer = await pc.createAnswer()
@@ -1260,14 +1389,14 @@ class SpreedClient:
         if self.defunct.is_set():
             logger.debug(
                 "Client defunct before sending answer, cleaning up",
-                extra={"session_id": spkr_sid, "room_token": self.room_token},
+                extra={"session_id": spkr_sid},
             )
             await pc.close()
             return
 
         await self.send_offer_answer(
             spkr_sid,
-            message["message"]["data"]["sid"],
+            offer_sid,
             answer.sdp,
         )
         logger.debug(
@@ -1275,20 +1404,19 @@ class SpreedClient:
             spkr_sid,
             extra={
                 "session_id": spkr_sid,
-                "room_token": self.room_token,
             },
         )
 
-        local_sdp = pc.localDescription.sdp
-        for line in local_sdp.splitlines():
-            if line.startswith("a=candidate:"):
-                if self.defunct.is_set():
-                    break
-                await self.send_candidate(
-                    message["message"]["sender"]["sessionid"],
-                    message["message"]["data"]["sid"],
-                    line[2:],
-                )
+        candidate_lines = _CANDIDATE_RE.findall(pc.localDescription.sdp)
+        if self.defunct.is_set():
+            return
+        await asyncio.gather(
+            *(
+                self.send_candidate(spkr_sid, offer_sid, line[2:])
+                for line in candidate_lines
+            ),
+            return_exceptions=True,
+        )
 
     async def _consume_transcriber_results(
         self, transcriber: ModalTranscriber, speaker_sid: str
@@ -1299,28 +1427,38 @@ class SpreedClient:
             transcriber: The transcriber instance
             speaker_sid: Speaker session ID
         """
-        accumulated_text = ""
+        parts: list[str] = []
+        total_len = 0
+        loop = asyncio.get_running_loop()
+        last_partial_at = float("-inf")
         try:
             async for result in transcriber.get_results():
                 if result.text:
-                    accumulated_text += result.text
+                    parts.append(result.text)
+                    total_len += len(result.text)
 
                 if result.is_vad_end or result.is_final:
-                    if accumulated_text.strip():
+                    text = "".join(parts).strip()
+                    if text:
                         transcript = Transcript(
                             final=True,
                             lang_id=self.lang_id,
-                            message=accumulated_text.strip(),
+                            message=text,
                             speaker_session_id=speaker_sid,
                         )
                         await self.transcript_queue.put(transcript)
-                    accumulated_text = ""
-                elif accumulated_text and len(accumulated_text) > 50:
-                    # Send partial results periodically
+                    parts.clear()
+                    total_len = 0
+                elif (
+                    total_len > 50
+                    and loop.time() - last_partial_at >= MIN_TRANSCRIPT_SEND_INTERVAL
+                ):
+                    # Send partial results periodically, coalescing token bursts
+                    last_partial_at = loop.time()
                     transcript = Transcript(
                         final=False,
                         lang_id=self.lang_id,
-                        message=accumulated_text,
+                        message="".join(parts),
                         speaker_session_id=speaker_sid,
                     )
                     await self.transcript_queue.put(transcript)
@@ -1329,7 +1467,6 @@ class SpreedClient:
                 "Transcriber result consumer cancelled",
                 extra={
                     "speaker_sid": speaker_sid,
-                    "room_token": self.room_token,
                 },
             )
         except Exception as e:
@@ -1338,16 +1475,26 @@ class SpreedClient:
                 exc_info=e,
                 extra={
                     "speaker_sid": speaker_sid,
-                    "room_token": self.room_token,
                 },
             )
 
+    def _forget_result_consumer(self, speaker_sid: str, task: asyncio.Task) -> None:
+        """Drop a finished result consumer task from the bookkeeping dict.
+
+        Args:
+            speaker_sid: Speaker session ID the task was consuming for
+            task: The finished task
+        """
+        if self._result_consumer_tasks.get(speaker_sid) is task:
+            del self._result_consumer_tasks[speaker_sid]
+
     async def set_language(self, lang_id: str) -> None:
         """Set the transcription language.
 
         Args:
             lang_id: Language code
         """
+        room_token_var.set(self.room_token)
         excs: list[Exception] = []
         async with self.transcriber_lock:
             transcribers = list(self.transcribers.values())
@@ -1361,7 +1508,6 @@ class SpreedClient:
                 "Failed to set language for multiple transcribers",
                 extra={
                     "lang_id": lang_id,
-                    "room_token": self.room_token,
                     "excs": excs,
                 },
             )
@@ -1378,48 +1524,43 @@ class SpreedClient:
 
     async def transcript_queue_consumer(self) -> None:
         """Consume transcripts from the queue and send them."""
-        logger.debug(
-            "Starting the transcript queue consumer",
-            extra={"room_token": self.room_token},
-        )
+        logger.debug("Starting the transcript queue consumer")
         while True:
-            if self.defunct.is_set():
-                logger.debug(
-                    "SpreedClient is defunct, waiting before sending transcripts",
-                    extra={"room_token": self.room_token},
-                )
-                await asyncio.sleep(2)
-                continue
-
+            await self._active_event.wait()
             transcript: Transcript = await self.transcript_queue.get()
+            batch = [transcript]
+            while len(batch) < TRANSCRIPT_BATCH_SIZE:
+                try:
+                    batch.append(self.transcript_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            batch = coalesce_transcripts(batch)
+            speakers = [t.speaker_session_id for t in batch]
 
             try:
                 await asyncio.wait_for(
-                    self.send_transcript(transcript),
+                    self.send_transcripts(batch),
                     timeout=10,
                 )
             except TimeoutError:
                 logger.error(
-                    "Timeout while sending a transcript",
+                    "Timeout while sending transcripts",
                     extra={
-                        "speaker_session_id": transcript.speaker_session_id,
-                        "room_token": self.room_token,
+                        "speaker_session_ids": speakers,
+                        "batch_size": len(batch),
                     },
                 )
                 continue
             except asyncio.CancelledError:
-                logger.debug(
-                    "Transcript consumer task cancelled",
-                    extra={"room_token": self.room_token},
-                )
+                logger.debug("Transcript consumer task cancelled")
                 raise
             except Exception as e:
                 logger.exception(
-                    "Error while sending transcript",
+                    "Error while sending transcripts",
                     exc_info=e,
                     extra={
-                        "speaker_session_id": transcript.speaker_session_id,
-                        "room_token": self.room_token,
+                        "speaker_session_ids": speakers,
+                        "batch_size": len(batch),
                     },
                 )
                 continue
@@ -2,19 +2,33 @@
 
 import asyncio
 import contextlib
-import gc
+import io
+import json
 import logging
+import math
 import os
 import shutil
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import AsyncGenerator, Optional, Protocol
+from typing import AsyncGenerator, BinaryIO, Callable, Optional, Protocol
 
 import numpy as np
 import websockets
 from websockets.client import WebSocketClientProtocol
 
+# Prefer orjson for decoding Modal messages when it is available
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Use scipy for high-quality resampling if available
+try:
+    from scipy import signal
+except ImportError:
+    signal = None
+
 from .constants import (
     KYUTAI_SAMPLE_RATE,
     MODAL_CONNECT_TIMEOUT,
@@ -29,16 +43,32 @@ from .livetypes import ModalConnectionError
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of transcription results waiting for the consumer
+RESULT_QUEUE_SIZE = 256
+
+# Capacity of the outgoing audio buffer; audio beyond the send threshold is
+# only held back while the Modal socket is congested
+SEND_BUFFER_MS = 1000
+
+# Incoming audio is resampled in batches of this much, rather than per
+# 20ms frame, to amortize the fixed cost of each resampler call
+RESAMPLE_BATCH_MS = 100
+
 
 class AudioStream(Protocol):
     """Protocol for audio streams."""
 
+    @property
+    def channels(self) -> Optional[int]:
+        """Number of channels, once known."""
+        ...
+
     async def get_frame(self) -> Optional[bytes]:
         """Get the next audio frame. Returns None when stream ends."""
         ...
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranscriptionResult:
     """Result from transcription service."""
 
@@ -47,46 +77,123 @@ class TranscriptionResult:
     is_vad_end: bool = False
 
 
-class RawPCMEncoder:
-    """Simple encoder that converts int16 PCM to float32 for Modal.
+# Results are immutable, so every VAD end can share one instance
+VAD_END_RESULT = TranscriptionResult(text="", is_final=True, is_vad_end=True)
 
-    Format: 32-bit float little-endian, mono, at the target sample rate.
-    Modal server expects float32 in range [-1.0, 1.0].
-    """
 
-    def __init__(self, sample_rate: int = KYUTAI_SAMPLE_RATE, channels: int = 1):
-        self.sample_rate = sample_rate
-        self.channels = channels
-        logger.info(f"Raw PCM encoder: {self.sample_rate}Hz, {self.channels}ch, float32le")
+def pcm16_to_mono_float32(
+    frame_data: bytes, channels: int = 2, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Convert interleaved int16 PCM to normalized float32 mono.
 
-    def encode(self, pcm_data: np.ndarray) -> bytes:
-        """Convert int16 PCM to float32 and return as bytes.
+    Multi-channel audio (WebRTC typically delivers stereo) is interleaved as
+    L R L R... and the channels are averaged. The channel sum and the scaling
+    to [-1.0, 1.0] are done in float32 directly, without an intermediate
+    int16 mono array.
 
-        Args:
-            pcm_data: PCM audio data as int16 numpy array
+    Args:
+        frame_data: Raw 16-bit PCM audio data; incomplete trailing samples
+            are ignored
+        channels: Number of interleaved channels in frame_data
+        out: Optional float32 buffer to write into, at least as long as the
+            output; when given, a view of it is returned and nothing is
+            allocated
 
-        Returns:
-            Raw PCM bytes (float32 LE format, range [-1.0, 1.0])
-        """
-        # Convert int16 (-32768 to 32767) to float32 (-1.0 to 1.0)
-        float_data = pcm_data.astype(np.float32) / 32768.0
-        return float_data.tobytes()
+    Returns:
+        Mono audio as float32 in range [-1.0, 1.0]
+    """
+    # A read-only view of the frame; count ignores a stray trailing byte,
+    # which would otherwise make frombuffer raise
+    audio = np.frombuffer(frame_data, dtype=np.int16, count=len(frame_data) // 2)
+    n = len(audio) // channels
+    mono = None if out is None else out[:n]
+    if channels == 1:
+        return np.multiply(
+            audio, np.float32(1.0 / 32768.0), out=mono, dtype=np.float32
+        )
 
-    def flush(self) -> bytes:
-        """Nothing to flush for raw PCM."""
-        return b""
+    # Drop a trailing incomplete sample, if any
+    interleaved = audio[: n * channels].reshape(n, channels)
+    if channels == 2:
+        mono = np.add(
+            interleaved[:, 0], interleaved[:, 1], out=mono, dtype=np.float32
+        )
+    else:
+        mono = interleaved.sum(axis=1, out=mono, dtype=np.float32)
+    # sum / channels / 32768
+    mono *= np.float32(1.0 / (32768.0 * channels))
+    return mono
 
 
 class AudioResampler:
-    """Resample audio between sample rates."""
+    """Resample a stream of audio chunks between sample rates.
+
+    The polyphase filter keeps the tail of the previous chunk as history, so
+    consecutive chunks are filtered as one continuous signal instead of each
+    being windowed on its own. Output is delayed by half the filter length.
+    """
+
+    # Half-length of the anti-aliasing filter, in taps per output phase
+    FILTER_HALF_LEN = 16
 
     def __init__(self, source_rate: int, target_rate: int):
         self.source_rate = source_rate
         self.target_rate = target_rate
         self.ratio = target_rate / source_rate
 
+        # Polyphase factors and filter are fixed for a given rate pair
+        gcd = math.gcd(source_rate, target_rate)
+        self.up = target_rate // gcd
+        self.down = source_rate // gcd
+        self.filt: Optional[np.ndarray] = None
+        # Interpolation indices and weights for the linear fallback, cached
+        # for the last frame length (-1 never matches, so the first call
+        # always builds them)
+        self._interp_len = -1
+        self._interp_lo: Optional[np.ndarray] = None
+        self._interp_hi: Optional[np.ndarray] = None
+        self._interp_frac: Optional[np.ndarray] = None
+        if signal is not None and source_rate != target_rate:
+            max_rate = max(self.up, self.down)
+            self.filt = signal.firwin(
+                2 * self.FILTER_HALF_LEN * max_rate + 1,
+                1.0 / max_rate,
+                window=("kaiser", 8.6),
+            ).astype(np.float32)
+            # Compensate for the zeros inserted when upsampling
+            self._taps = self.filt * np.float32(self.up)
+            self.reset()
+
+    def reset(self) -> None:
+        """Forget the stream history, as if no audio had been resampled yet."""
+        if self.filt is None:
+            return
+        taps = len(self.filt)
+        # Zero history long enough for the first output, plus room to align
+        # the output phase (see _align_start)
+        history = -(-(taps - 1) // self.up) + self.down - 1
+        # Working buffer: the history followed by the incoming chunk. It is
+        # reused across chunks and only grows for larger chunks.
+        self._work = np.zeros(history, dtype=np.float32)
+        self._history_len = history
+        # Position of the next output in the upsampled tail, centred on the
+        # filter so output sample m lines up with input time m * down / up
+        self._next_pos = history * self.up + (taps - 1) // 2
+
+    def _align_start(self, next_pos: int) -> int:
+        """Return the input index to filter from so outputs land on next_pos.
+
+        upfirdn produces outputs every ``down`` upsampled samples from the
+        start of its input, so the start must be congruent to next_pos and
+        leave a full filter length of history before it.
+        """
+        start = (next_pos - len(self.filt) + 1) // self.up
+        while (next_pos - start * self.up) % self.down:
+            start -= 1
+        return start
+
     def resample(self, audio: np.ndarray) -> np.ndarray:
-        """Resample audio data.
+        """Resample the next chunk of the stream.
 
         Args:
             audio: Input audio as numpy array
@@ -97,17 +204,51 @@ class AudioResampler:
         if self.source_rate == self.target_rate:
             return audio
 
-        # Use scipy for high-quality resampling if available
-        try:
-            from scipy import signal
-
-            num_samples = int(len(audio) * self.ratio)
-            return signal.resample(audio, num_samples).astype(np.int16)
-        except ImportError:
-            # Simple linear interpolation fallback
-            indices = np.arange(0, len(audio), 1 / self.ratio)
-            indices = indices[indices < len(audio) - 1].astype(int)
-            return audio[indices]
+        if self.filt is not None:
+            size = self._history_len + len(audio)
+            if len(self._work) < size:
+                work = np.empty(size, dtype=np.float32)
+                work[: self._history_len] = self._work[: self._history_len]
+                self._work = work
+            buf = self._work[:size]
+            buf[self._history_len :] = audio
+            count = max(0, -(-(len(buf) * self.up - self._next_pos) // self.down))
+            start = self._align_start(self._next_pos)
+            first = (self._next_pos - start * self.up) // self.down
+            out = signal.upfirdn(self._taps, buf[start:], self.up, self.down)
+            out = out[first : first + count]
+
+            # Keep only the history needed for the next chunk
+            next_pos = self._next_pos + count * self.down
+            keep_from = max(
+                0, (next_pos - len(self.filt) + 1) // self.up - (self.down - 1)
+            )
+            self._history_len = size - keep_from
+            buf[: self._history_len] = buf[keep_from:]
+            self._next_pos = next_pos - keep_from * self.up
+            if np.issubdtype(audio.dtype, np.integer):
+                # Round and saturate instead of truncating and wrapping around
+                # (in place: out is a fresh array from upfirdn)
+                limits = np.iinfo(audio.dtype)
+                np.rint(out, out=out)
+                np.clip(out, limits.min, limits.max, out=out)
+            return out.astype(audio.dtype, copy=False)
+
+        # Simple linear interpolation fallback; frames have a fixed length,
+        # so the indices and weights are only rebuilt when it changes
+        if len(audio) != self._interp_len:
+            self._interp_len = len(audio)
+            pos = np.arange(int(len(audio) * self.ratio)) / self.ratio
+            self._interp_lo = pos.astype(np.intp)
+            self._interp_hi = np.minimum(self._interp_lo + 1, len(audio) - 1)
+            self._interp_frac = (pos - self._interp_lo).astype(np.float32)
+        lo = audio[self._interp_lo].astype(np.float32)
+        out = audio[self._interp_hi] - lo
+        out *= self._interp_frac
+        out += lo
+        if np.issubdtype(audio.dtype, np.integer):
+            np.round(out, out=out)
+        return out.astype(audio.dtype, copy=False)
 
 
 class ModalTranscriber:
@@ -135,28 +276,47 @@ class ModalTranscriber:
         self.workspace = workspace or MODAL_WORKSPACE
         self.modal_key = modal_key or MODAL_KEY
         self.modal_secret = modal_secret or MODAL_SECRET
+        # Modal WebSocket URL and authentication headers, built once
+        self.url = f"wss://{self.workspace}--{MODAL_STT_HOST_SUFFIX}/v1/stream"
+        self._headers = [
+            ("Modal-Key", self.modal_key),
+            ("Modal-Secret", self.modal_secret),
+        ]
 
         self._ws: Optional[WebSocketClientProtocol] = None
-        self._running = False
+        # Set whenever the transcriber is not running; see the _running property
+        self._stopped = asyncio.Event()
+        self._stopped.set()
         self._send_task: Optional[asyncio.Task] = None
         self._recv_task: Optional[asyncio.Task] = None
-        self._audio_queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
-        self._result_queue: asyncio.Queue[TranscriptionResult] = asyncio.Queue()
+        self._transcript_log_task: Optional[asyncio.Task] = None
+        # Bounded so a stalled consumer makes the receive loop wait instead
+        # of buffering results without limit
+        self._result_queue: asyncio.Queue[TranscriptionResult] = asyncio.Queue(
+            maxsize=RESULT_QUEUE_SIZE
+        )
 
         # Audio processing
         self._resampler = AudioResampler(WEBRTC_SAMPLE_RATE, KYUTAI_SAMPLE_RATE)
-        self._encoder = RawPCMEncoder(KYUTAI_SAMPLE_RATE, 1)
-        self._audio_buffer: list[np.ndarray] = []
-        self._buffer_duration_ms = 0
+        # Float32 mono input at the WebRTC rate waiting to be resampled
+        self._resample_batch = WEBRTC_SAMPLE_RATE * RESAMPLE_BATCH_MS // 1000
+        self._input_buf = np.empty(2 * self._resample_batch, dtype=np.float32)
+        self._input_pos = 0
+        # Preallocated float32 mono buffer that frames are written into and
+        # sent from; Modal expects float32 LE in range [-1.0, 1.0]
+        self._ring = np.empty(
+            KYUTAI_SAMPLE_RATE * SEND_BUFFER_MS // 1000, dtype=np.float32
+        )
+        self._write_pos = 0
         self._min_buffer_ms = 200  # Buffer 200ms before sending (reduce latency)
 
         # Transcript logging (for debugging)
-        self._transcript_buffer: list[str] = []
-        self._last_transcript_log = 0.0
+        self._transcript_buffer = io.StringIO()
         self._transcript_log_interval = 5.0  # Log every 5 seconds
 
         # Audio capture for debugging
         self._debug_audio_dir: Optional[Path] = None
+        self._debug_audio_file: Optional[BinaryIO] = None
         self._audio_frame_count = 0
         self._total_audio_bytes = 0
         self._first_audio_sent = False  # Track if we've logged first audio send
@@ -166,22 +326,23 @@ class ModalTranscriber:
         self._last_audio_sent_time = 0.0
         self._last_message_time = 0.0  # Any message from Modal (ping, token, vad_end, etc.)
         self._stale_warned = False
+        self._last_stale_check = 0.0  # The check runs at most once per second
 
         logger.info(
             f"Created ModalTranscriber for session {session_id}, language={language}"
         )
 
     @property
-    def url(self) -> str:
-        """Get the Modal WebSocket URL."""
-        return f"wss://{self.workspace}--{MODAL_STT_HOST_SUFFIX}/v1/stream"
-
-    def _get_headers(self) -> dict[str, str]:
-        """Get authentication headers for Modal."""
-        return {
-            "Modal-Key": self.modal_key,
-            "Modal-Secret": self.modal_secret,
-        }
+    def _running(self) -> bool:
+        """Whether the transcriber is running."""
+        return not self._stopped.is_set()
+
+    @_running.setter
+    def _running(self, running: bool) -> None:
+        if running:
+            self._stopped.clear()
+        else:
+            self._stopped.set()
 
     async def connect(self) -> None:
         """Connect to the Modal transcription service."""
@@ -195,11 +356,14 @@ class ModalTranscriber:
             self._ws = await asyncio.wait_for(
                 websockets.connect(
                     self.url,
-                    additional_headers=self._get_headers(),
+                    additional_headers=self._headers,
                     open_timeout=MODAL_CONNECT_TIMEOUT,
                     ping_interval=30,
                     ping_timeout=10,
                     max_size=None,
+                    # Raw float32 PCM barely compresses; deflating every
+                    # audio message would only cost CPU and latency
+                    compression=None,
                 ),
                 timeout=MODAL_CONNECT_TIMEOUT,
             )
@@ -238,6 +402,10 @@ class ModalTranscriber:
                 f.write(f"  ffplay -f s16le -ar {WEBRTC_SAMPLE_RATE} -ac 2 audio_raw.pcm\n")
                 f.write("\nTo convert to WAV:\n")
                 f.write(f"  ffmpeg -f s16le -ar {WEBRTC_SAMPLE_RATE} -ac 2 -i audio_raw.pcm audio.wav\n")
+            # Keep the capture file open for the session instead of per frame
+            self._debug_audio_file = open(
+                self._debug_audio_dir / "audio_raw.pcm", "ab", buffering=1024 * 1024
+            )
             logger.info(f"Saving debug audio to {self._debug_audio_dir}")
 
         # Connect to Modal first (this can take time for cold start)
@@ -248,9 +416,10 @@ class ModalTranscriber:
 
         self._running = True
 
-        # Start send and receive tasks
+        # Start send, receive and transcript log tasks
         self._send_task = asyncio.create_task(self._send_audio_loop(audio_stream))
         self._recv_task = asyncio.create_task(self._receive_results_loop())
+        self._transcript_log_task = asyncio.create_task(self._transcript_log_loop())
 
         logger.info(f"Started transcription for session {self.session_id}")
 
@@ -264,7 +433,10 @@ class ModalTranscriber:
                     self._running = False
                     break
 
-                await self._process_and_send_audio(frame)
+                # The channel count is known once the first frame arrived;
+                # WebRTC audio is typically stereo
+                channels = audio_stream.channels or 2
+                await self._process_and_send_audio(frame, channels)
 
                 # Check for stale connection (audio being sent but no transcripts)
                 await self._check_stale_connection()
@@ -277,6 +449,7 @@ class ModalTranscriber:
             with contextlib.suppress(Exception):
                 await audio_stream.stop()
             # Send any remaining buffered audio
+            await self._buffer_pending_input()
             await self._flush_buffer()
 
     async def _check_stale_connection(self) -> None:
@@ -287,6 +460,9 @@ class ModalTranscriber:
         diagnose Modal issues while avoiding false positives during silence.
         """
         now = time.time()
+        if now - self._last_stale_check < 1.0:
+            return
+        self._last_stale_check = now
 
         # Only check if we've been actively sending audio recently (within last 5s)
         if self._last_audio_sent_time == 0 or (now - self._last_audio_sent_time) > 5:
@@ -314,60 +490,103 @@ class ModalTranscriber:
                 )
                 self._stale_warned = True
 
-    async def _process_and_send_audio(self, frame_data: bytes) -> None:
+    async def _process_and_send_audio(
+        self, frame_data: bytes, channels: int = 2
+    ) -> None:
         """Process audio frame and send to Modal when buffer is full.
 
         Args:
             frame_data: Raw PCM audio data (typically 48kHz)
+            channels: Number of interleaved channels in frame_data
         """
         if not self._ws:
             return
 
         # Save raw audio for debugging
-        if self._debug_audio_dir:
+        if self._debug_audio_file:
             self._audio_frame_count += 1
             self._total_audio_bytes += len(frame_data)
-            # Save every frame to a file (append mode for efficiency)
-            raw_file = self._debug_audio_dir / "audio_raw.pcm"
-            with open(raw_file, "ab") as f:
-                f.write(frame_data)
+            self._debug_audio_file.write(frame_data)
             # Log progress every 500 frames (~10 seconds)
             if self._audio_frame_count % 500 == 0:
                 logger.debug(
-                    f"Audio capture: {self._audio_frame_count} frames, "
-                    f"{self._total_audio_bytes / 1024:.1f} KB total"
+                    "Audio capture: %d frames, %.1f KB total",
+                    self._audio_frame_count,
+                    self._total_audio_bytes / 1024,
                 )
 
-        # Convert bytes to numpy array (assuming 16-bit PCM)
-        audio = np.frombuffer(frame_data, dtype=np.int16)
+        # Conversion and resampling run inline on the event loop: for a 20ms
+        # frame they take tens of microseconds, less than handing the frame
+        # to a worker thread and back would cost.
+        #
+        # Convert 16-bit PCM to float32 mono in one pass, appending it to the
+        # input waiting to be resampled
+        needed = self._input_pos + len(frame_data) // 2
+        if len(self._input_buf) < needed:
+            grown = np.empty(needed, dtype=np.float32)
+            grown[: self._input_pos] = self._input_buf[: self._input_pos]
+            self._input_buf = grown
+        audio = pcm16_to_mono_float32(
+            frame_data, channels, out=self._input_buf[self._input_pos :]
+        )
+        self._input_pos += len(audio)
 
-        # Convert stereo to mono (WebRTC typically delivers stereo)
-        # Interleaved stereo: L R L R L R... -> average channels
-        if len(audio) % 2 == 0:
-            audio = audio.reshape(-1, 2).mean(axis=1).astype(np.int16)
+        if self._input_pos >= self._resample_batch:
+            await self._buffer_pending_input()
 
-        # Resample from WebRTC rate to Kyutai rate
-        resampled = self._resampler.resample(audio)
+    async def _buffer_pending_input(self) -> None:
+        """Resample the pending input and add it to the send buffer.
+
+        Sends the buffer to Modal once it holds enough audio.
+        """
+        if not self._input_pos:
+            return
 
-        # Add to buffer
-        self._audio_buffer.append(resampled)
-        self._buffer_duration_ms += len(resampled) * 1000 / KYUTAI_SAMPLE_RATE
+        # Resample from WebRTC rate to Kyutai rate
+        resampled = self._resampler.resample(self._input_buf[: self._input_pos])
+        self._input_pos = 0
 
-        # Send when we have enough audio
-        if self._buffer_duration_ms >= self._min_buffer_ms:
+        # Add to buffer, making room first if needed
+        n = len(resampled)
+        if self._write_pos + n > len(self._ring):
+            await self._flush_buffer()
+            if self._write_pos + n > len(self._ring):
+                # Sending keeps failing; drop the audio that could not be sent
+                self._write_pos = 0
+            if n > len(self._ring):
+                self._ring = np.empty(n, dtype=np.float32)
+        self._ring[self._write_pos : self._write_pos + n] = resampled
+        self._write_pos += n
+
+        # Send when we have enough audio (compared in integer sample units).
+        # While earlier sends are still queued in the transport, keep
+        # buffering so the backlog goes out as fewer, larger messages; a
+        # full buffer is flushed regardless above.
+        if (
+            self._write_pos * 1000 >= self._min_buffer_ms * KYUTAI_SAMPLE_RATE
+            and not self._send_congested()
+        ):
             await self._flush_buffer()
 
+    def _send_congested(self) -> bool:
+        """Whether previously sent audio is still waiting in the transport."""
+        transport = getattr(self._ws, "transport", None)
+        return transport is not None and transport.get_write_buffer_size() > 0
+
+    @property
+    def _buffer_duration_ms(self) -> int:
+        """Duration of the audio buffered and not yet sent, in whole ms."""
+        return self._write_pos * 1000 // KYUTAI_SAMPLE_RATE
+
     async def _flush_buffer(self) -> None:
         """Flush audio buffer to Modal."""
-        if not self._audio_buffer or not self._ws:
+        if not self._write_pos or not self._ws:
             return
 
         try:
-            # Concatenate all buffered audio
-            combined = np.concatenate(self._audio_buffer)
-
-            # Encode to Opus
-            encoded = self._encoder.encode(combined)
+            # Send a byte view of the buffer; the websocket client copies it
+            # while masking the frame, so the buffer can be reused right away
+            encoded = memoryview(self._ring[: self._write_pos]).cast("B")
 
             # Send to Modal
             await self._ws.send(encoded)
@@ -382,12 +601,13 @@ class ModalTranscriber:
                 self._first_audio_sent = True
             else:
                 logger.debug(
-                    f"Sent {self._buffer_duration_ms:.0f}ms of audio ({len(encoded)} bytes) to Modal"
+                    "Sent %dms of audio (%d bytes) to Modal",
+                    self._buffer_duration_ms,
+                    len(encoded),
                 )
 
             # Clear buffer
-            self._audio_buffer = []
-            self._buffer_duration_ms = 0
+            self._write_pos = 0
         except websockets.ConnectionClosed as e:
             logger.warning(
                 "Modal connection closed while sending audio (%s). Stopping transcriber.",
@@ -395,8 +615,7 @@ class ModalTranscriber:
             )
             self._running = False
             self._ws = None
-            self._audio_buffer = []
-            self._buffer_duration_ms = 0
+            self._write_pos = 0
         except Exception as e:
             logger.error(f"Error sending audio: {e}")
 
@@ -405,8 +624,12 @@ class ModalTranscriber:
         if not self._ws:
             return
 
+        ws = self._ws
         try:
-            async for message in self._ws:
+            while True:
+                # Take text frames as undecoded bytes; the JSON decoder reads
+                # UTF-8 bytes directly, so decoding to str first is wasted
+                message = await ws.recv(decode=False)
                 if not self._running:
                     break
 
@@ -422,72 +645,92 @@ class ModalTranscriber:
         except Exception as e:
             logger.error(f"Error in receive loop: {e}")
 
-    def _parse_result(self, message: str) -> Optional[TranscriptionResult]:
+    def _parse_result(self, message: str | bytes) -> Optional[TranscriptionResult]:
         """Parse a result message from Modal.
 
         Args:
-            message: JSON message from Modal
+            message: JSON message from Modal, from a text or a binary frame
 
         Returns:
             Parsed TranscriptionResult or None
         """
-        import json
-
         try:
-            data = json.loads(message)
-            msg_type = data.get("type")
-
-            # Track any message received to detect stale connections
-            self._last_message_time = time.time()
-
-            if msg_type == "token":
-                text = data.get("text", "")
-                if text:
-                    self._transcript_buffer.append(text)
-                    # Log accumulated transcript every N seconds
-                    now = time.time()
-                    if now - self._last_transcript_log >= self._transcript_log_interval:
-                        transcript = "".join(self._transcript_buffer)
-                        if transcript.strip():
-                            self._log_transcript(transcript)
-                        self._transcript_buffer = []
-                        self._last_transcript_log = now
-                return TranscriptionResult(text=text, is_final=False)
-            elif msg_type == "vad_end":
-                # Log any remaining transcript on VAD end
-                if self._transcript_buffer:
-                    transcript = "".join(self._transcript_buffer)
-                    if transcript.strip():
-                        self._log_transcript(transcript, final=True)
-                    self._transcript_buffer = []
-                return TranscriptionResult(text="", is_final=True, is_vad_end=True)
-            elif msg_type == "error":
-                logger.error(f"Modal error: {data.get('message')}")
-                return None
-            elif msg_type == "ping":
-                # Ignore keepalive pings
-                return None
-            else:
-                logger.debug(f"Unknown message type: {msg_type}")
-                return None
+            data = json_loads(message)
         except json.JSONDecodeError as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             logger.error(f"Failed to parse Modal message: {e}")
             return None
 
+        # Track any message received to detect stale connections
+        self._last_message_time = time.time()
+
+        msg_type = data.get("type")
+        handler = self._HANDLERS.get(msg_type)
+        if handler is None:
+            logger.debug("Unknown message type: %s", msg_type)
+            return None
+        return handler(self, data)
+
+    def _handle_token(self, data: dict) -> TranscriptionResult:
+        """Handle a transcribed token."""
+        text = data.get("text", "")
+        if text:
+            # Logged periodically by _transcript_log_loop
+            self._transcript_buffer.write(text)
+        return TranscriptionResult(text=text, is_final=False)
+
+    def _handle_vad_end(self, data: dict) -> TranscriptionResult:
+        """Handle the end of a speech segment."""
+        # Log any remaining transcript on VAD end
+        self._flush_transcript_log(final=True)
+        return VAD_END_RESULT
+
+    def _handle_error(self, data: dict) -> None:
+        """Handle an error reported by Modal."""
+        logger.error(f"Modal error: {data.get('message')}")
+
+    def _handle_ping(self, data: dict) -> None:
+        """Ignore keepalive pings."""
+
+    # Handlers for Modal messages, by message type; shared by all instances
+    _HANDLERS: dict[
+        str, Callable[["ModalTranscriber", dict], Optional[TranscriptionResult]]
+    ] = {
+        "token": _handle_token,
+        "vad_end": _handle_vad_end,
+        "error": _handle_error,
+        "ping": _handle_ping,
+    }
+
     async def get_results(self) -> AsyncGenerator[TranscriptionResult, None]:
         """Async generator that yields transcription results.
 
         Yields:
             TranscriptionResult objects as they arrive
         """
-        while self._running or not self._result_queue.empty():
-            try:
-                result = await asyncio.wait_for(
-                    self._result_queue.get(), timeout=1.0
-                )
-                yield result
-            except asyncio.TimeoutError:
-                continue
+        stopped = asyncio.create_task(self._stopped.wait())
+        try:
+            while self._running or not self._result_queue.empty():
+                if not self._result_queue.empty():
+                    yield self._result_queue.get_nowait()
+                    continue
+
+                # Wait for the next result, or for the transcriber to stop
+                if stopped.done():
+                    # Stopped and started again since the last wait
+                    stopped = asyncio.create_task(self._stopped.wait())
+                get = asyncio.create_task(self._result_queue.get())
+                try:
+                    done, _ = await asyncio.wait(
+                        (get, stopped), return_when=asyncio.FIRST_COMPLETED
+                    )
+                finally:
+                    if not get.done():
+                        get.cancel()
+                if get in done:
+                    yield get.result()
+        finally:
+            stopped.cancel()
 
     async def stop(self) -> None:
         """Stop transcription and clean up."""
@@ -509,19 +752,23 @@ class ModalTranscriber:
             except asyncio.CancelledError:
                 pass
 
+        if self._transcript_log_task:
+            self._transcript_log_task.cancel()
+            try:
+                await self._transcript_log_task
+            except asyncio.CancelledError:
+                pass
+
         # Close WebSocket
         if self._ws:
             await self._ws.close()
             self._ws = None
 
         # Clear buffers and queues to release memory
-        self._audio_buffer.clear()
-        self._transcript_buffer.clear()
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        self._input_pos = 0
+        self._write_pos = 0
+        self._transcript_buffer.seek(0)
+        self._transcript_buffer.truncate()
         while not self._result_queue.empty():
             try:
                 self._result_queue.get_nowait()
@@ -529,6 +776,9 @@ class ModalTranscriber:
                 break
 
         # Log audio capture summary and cleanup debug files
+        if self._debug_audio_file:
+            self._debug_audio_file.close()
+            self._debug_audio_file = None
         if self._debug_audio_dir and self._audio_frame_count > 0:
             # Stereo 16-bit = 4 bytes per sample (2 channels × 2 bytes)
             duration_sec = self._total_audio_bytes / (WEBRTC_SAMPLE_RATE * 4)
@@ -547,9 +797,6 @@ class ModalTranscriber:
                 logger.warning(f"Failed to clean up debug audio: {e}")
         self._debug_audio_dir = None
 
-        # Force garbage collection to release numpy arrays and buffers
-        gc.collect()
-
         logger.info(f"Transcriber stopped for session {self.session_id}")
 
     def set_language(self, language: str) -> None:
@@ -564,6 +811,22 @@ class ModalTranscriber:
         self.language = language
         logger.info(f"Language set to {language} for session {self.session_id}")
 
+    async def _transcript_log_loop(self) -> None:
+        """Log the accumulated transcript every few seconds while running."""
+        while self._running:
+            await asyncio.sleep(self._transcript_log_interval)
+            self._flush_transcript_log()
+
+    def _flush_transcript_log(self, final: bool = False) -> None:
+        """Log and clear the transcript accumulated since the last log."""
+        if not self._transcript_buffer.tell():
+            return
+        transcript = self._transcript_buffer.getvalue()
+        if transcript.strip():
+            self._log_transcript(transcript, final=final)
+        self._transcript_buffer.seek(0)
+        self._transcript_buffer.truncate()
+
     def _log_transcript(self, transcript: str, final: bool = False) -> None:
         """Log transcript text with speaker context."""
         final_tag = " (final)" if final else ""
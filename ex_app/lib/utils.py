@@ -4,8 +4,8 @@ import hashlib
 import hmac
 import logging
 import os
-import re
 import ssl
+from contextvars import ContextVar
 from urllib.parse import urlparse
 
 from nc_py_api import NextcloudApp
@@ -14,6 +14,18 @@ from .livetypes import HPBSettings
 
 logger = logging.getLogger(__name__)
 
+# Room token of the call being handled in the current context, attached to log records
+room_token_var: ContextVar[str] = ContextVar("room_token", default="")
+
+
+class RoomTokenFilter(logging.Filter):
+    """Attach the room token of the current context to log records."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "room_token"):
+            record.room_token = room_token_var.get()
+        return True
+
 
 def hmac_sha256(key: str, message: str) -> str:
     """Generate HMAC-SHA256 signature.
@@ -145,10 +157,13 @@ def sanitize_websocket_url(ws_url: str) -> str:
     Returns:
         Properly formatted WebSocket URL ending with /spreed
     """
-    ws_url = re.sub(r"^http://", "ws://", ws_url)
-    ws_url = re.sub(r"^https://", "wss://", ws_url)
-    if not ws_url.removesuffix("/").endswith("/spreed"):
-        ws_url = ws_url.removesuffix("/") + "/spreed"
+    if ws_url.startswith("http://"):
+        ws_url = "ws://" + ws_url[len("http://") :]
+    elif ws_url.startswith("https://"):
+        ws_url = "wss://" + ws_url[len("https://") :]
+    trimmed = ws_url.removesuffix("/")
+    if not trimmed.endswith("/spreed"):
+        ws_url = trimmed + "/spreed"
     return ws_url
 
 
@@ -0,0 +1,376 @@
+"""Tests for spreed_client module."""
+
+import asyncio
+import functools
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ex_app.lib.livetypes import HPBSettings, Target, Transcript
+from ex_app.lib.spreed_client import SpreedClient, coalesce_transcripts
+from ex_app.lib.transcriber import TranscriptionResult
+
+
+@pytest.fixture
+def client():
+    """SpreedClient with the Nextcloud connection mocked out."""
+    with patch("ex_app.lib.spreed_client.NextcloudApp", MagicMock()):
+        client = SpreedClient(
+            room_token="room123",
+            hpb_settings=HPBSettings(),
+            lang_id="en",
+            leave_call_cb=AsyncMock(),
+        )
+    client.close = AsyncMock()
+    return client
+
+
+def _transcript(speaker: str, message: str, final: bool) -> Transcript:
+    return Transcript(
+        final=final,
+        lang_id="en",
+        message=message,
+        speaker_session_id=speaker,
+    )
+
+
+class TestCoalesceTranscripts:
+    """Tests for coalesce_transcripts function."""
+
+    def test_empty_batch(self):
+        """Should return an empty list for an empty batch."""
+        assert coalesce_transcripts([]) == []
+
+    def test_drops_superseded_partials(self):
+        """Should keep only the newest partial per speaker."""
+        batch = [
+            _transcript("a", "hello", final=False),
+            _transcript("a", "hello wor", final=False),
+            _transcript("a", "hello world", final=False),
+        ]
+        assert coalesce_transcripts(batch) == [batch[2]]
+
+    def test_final_supersedes_partial(self):
+        """Should drop a partial followed by a final from the same speaker."""
+        batch = [
+            _transcript("a", "hello", final=False),
+            _transcript("a", "hello world", final=True),
+        ]
+        assert coalesce_transcripts(batch) == [batch[1]]
+
+    def test_keeps_all_finals(self):
+        """Should never drop final transcripts."""
+        batch = [
+            _transcript("a", "first", final=True),
+            _transcript("a", "second", final=True),
+        ]
+        assert coalesce_transcripts(batch) == batch
+
+    def test_speakers_are_independent(self):
+        """Should keep the latest partial of each speaker, in queue order."""
+        batch = [
+            _transcript("a", "hi", final=False),
+            _transcript("b", "bonjour", final=False),
+            _transcript("a", "hi there", final=False),
+        ]
+        assert coalesce_transcripts(batch) == [batch[1], batch[2]]
+
+
+class TestDeferredClose:
+    """Tests for the deferred close worker."""
+
+    @pytest.mark.asyncio
+    async def test_closes_after_timeout_without_targets(self, client):
+        """Should close the client once the deadline expires with no targets."""
+        with patch("ex_app.lib.spreed_client.CALL_LEAVE_TIMEOUT", 0.01):
+            worker = asyncio.create_task(client._deferred_close_worker())
+            client._schedule_deferred_close()
+            await asyncio.sleep(0.05)
+            worker.cancel()
+
+        await asyncio.sleep(0)
+        client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_deadline_does_not_close(self, client):
+        """Should not close when the deadline is disarmed before it expires."""
+        with patch("ex_app.lib.spreed_client.CALL_LEAVE_TIMEOUT", 0.02):
+            worker = asyncio.create_task(client._deferred_close_worker())
+            client._schedule_deferred_close()
+            await asyncio.sleep(0)
+            client._cancel_deferred_close()
+            await asyncio.sleep(0.05)
+            worker.cancel()
+
+        client.close.assert_not_awaited()
+
+
+def _participants_update(*users: dict) -> dict:
+    return {"event": {"update": {"users": list(users)}}}
+
+
+class TestParticipantsUpdate:
+    """Tests for participants update handling."""
+
+    @pytest.mark.asyncio
+    async def test_closes_when_last_user_leaves(self, client):
+        """Should close when only our own session is left in the call."""
+        client.sessionid = "self"
+        await client._handle_participants_update(
+            _participants_update(
+                {"sessionId": "self", "inCall": 1, "internal": True},
+                {"sessionId": "peer", "inCall": 1},
+            )
+        )
+        await client._handle_participants_update(
+            _participants_update(
+                {"sessionId": "self", "inCall": 1, "internal": True},
+                {"sessionId": "peer", "inCall": 0},
+            )
+        )
+        await asyncio.sleep(0)
+        client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stays_while_others_in_call(self, client):
+        """Should not close while another participant is still in the call."""
+        client.sessionid = "self"
+        await client._handle_participants_update(
+            _participants_update(
+                {"sessionId": "self", "inCall": 1, "internal": True},
+                {"sessionId": "peer1", "inCall": 1},
+                {"sessionId": "peer2", "inCall": 1},
+            )
+        )
+        await client._handle_participants_update(
+            _participants_update({"sessionId": "peer1", "inCall": 0})
+        )
+        await asyncio.sleep(0)
+        client.close.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_participants_are_skipped(self, client):
+        """Should only act on participants whose call state changed."""
+        client.send_offer_request = AsyncMock()
+        update = _participants_update({"sessionId": "peer", "inCall": 3})
+
+        await client._handle_participants_update(update)
+        client.send_offer_request.assert_awaited_once_with("peer")
+
+        peer = MagicMock()
+        peer.pc.connectionState = "connected"
+        client.peer_connections["peer"] = peer
+        await client._handle_participants_update(update)
+        client.send_offer_request.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reoffers_without_peer_connection(self, client):
+        """Should request a new offer while a speaker has no peer connection."""
+        client.send_offer_request = AsyncMock()
+        update = _participants_update({"sessionId": "peer", "inCall": 3})
+
+        await client._handle_participants_update(update)
+        await client._handle_participants_update(update)
+        assert client.send_offer_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_deferred_target_added_on_join(self, client):
+        """Should add a target requested before its session was known."""
+        await client.add_target("nc-peer")
+        assert client.targets == {}
+
+        await client._handle_participants_update(
+            _participants_update(
+                {"sessionId": "peer", "nextcloudSessionId": "nc-peer", "inCall": 1}
+            )
+        )
+        assert list(client.targets) == ["peer"]
+        assert "nc-peer" not in client._nc_sid_wait_stash
+
+    @pytest.mark.asyncio
+    async def test_disconnect_removes_target(self, client):
+        """Should drop the target and session mapping of a leaving user."""
+        await client._handle_participants_update(
+            _participants_update(
+                {"sessionId": "peer", "nextcloudSessionId": "nc-peer", "inCall": 1}
+            )
+        )
+        await client.add_target("nc-peer")
+        await client._handle_participants_update(
+            _participants_update(
+                {"sessionId": "peer", "nextcloudSessionId": "nc-peer", "inCall": 0}
+            )
+        )
+        assert client.targets == {}
+        assert "nc-peer" not in client.nc_sid_map
+
+    @pytest.mark.asyncio
+    async def test_offers_requested_for_all_joiners(self, client):
+        """Should request an offer from every speaker joining at once."""
+        client.send_offer_request = AsyncMock()
+        await client._handle_participants_update(
+            _participants_update(
+                {"sessionId": "peer1", "inCall": 3},
+                {"sessionId": "peer2", "inCall": 3},
+                {"sessionId": "peer3", "inCall": 1},
+            )
+        )
+        assert sorted(c.args[0] for c in client.send_offer_request.await_args_list) == [
+            "peer1",
+            "peer2",
+        ]
+
+
+class TestRtcConfig:
+    """Tests for the shared RTC configuration."""
+
+    def test_builds_ice_servers_from_settings(self):
+        """Should include STUN and TURN servers from the HPB settings."""
+        settings = HPBSettings(
+            stunservers=[{"urls": ["stun:stun.example.com:3478"]}],
+            turnservers=[
+                {
+                    "urls": ["turn:turn.example.com:3478"],
+                    "username": "user",
+                    "credential": "pass",
+                }
+            ],
+        )
+        with patch("ex_app.lib.spreed_client.NextcloudApp", MagicMock()):
+            client = SpreedClient(
+                room_token="room123",
+                hpb_settings=settings,
+                lang_id="en",
+                leave_call_cb=AsyncMock(),
+            )
+        ice_servers = client._rtc_config.iceServers
+        assert [server.urls for server in ice_servers] == [
+            ["stun:stun.example.com:3478"],
+            ["turn:turn.example.com:3478"],
+        ]
+        assert ice_servers[1].username == "user"
+
+    def test_no_ice_servers(self, client):
+        """Should fall back to aiortc defaults without configured servers."""
+        assert client._rtc_config.iceServers is None
+
+
+class _FakeTranscriber:
+    """Transcriber stub yielding a fixed sequence of results."""
+
+    def __init__(self, results: list[TranscriptionResult]):
+        self._results = results
+
+    async def get_results(self):
+        for result in self._results:
+            yield result
+
+
+class TestConsumeTranscriberResults:
+    """Tests for turning transcriber results into queued transcripts."""
+
+    @pytest.mark.asyncio
+    async def test_token_burst_yields_one_partial(self, client):
+        """Should queue a single partial for a burst of tokens."""
+        tokens = [TranscriptionResult(text=" word", is_final=False)] * 30
+        await client._consume_transcriber_results(_FakeTranscriber(tokens), "spk")
+
+        queued = []
+        while not client.transcript_queue.empty():
+            queued.append(client.transcript_queue.get_nowait())
+        assert len(queued) == 1
+        assert queued[0].final is False
+
+    @pytest.mark.asyncio
+    async def test_vad_end_queues_final(self, client):
+        """Should queue the stripped utterance as final on VAD end."""
+        results = [
+            TranscriptionResult(text=" Hello", is_final=False),
+            TranscriptionResult(text=" world", is_final=False),
+            TranscriptionResult(text="", is_final=True, is_vad_end=True),
+        ]
+        await client._consume_transcriber_results(_FakeTranscriber(results), "spk")
+
+        transcript = client.transcript_queue.get_nowait()
+        assert transcript.final is True
+        assert transcript.message == "Hello world"
+        assert transcript.speaker_session_id == "spk"
+        assert client.transcript_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_finished_consumer_is_forgotten(self, client):
+        """Should drop the consumer task from the dict once it finishes."""
+        task = asyncio.create_task(
+            client._consume_transcriber_results(_FakeTranscriber([]), "spk")
+        )
+        client._result_consumer_tasks["spk"] = task
+        task.add_done_callback(functools.partial(client._forget_result_consumer, "spk"))
+        await task
+        await asyncio.sleep(0)
+        assert "spk" not in client._result_consumer_tasks
+
+
+class TestSendTranscripts:
+    """Tests for sending transcripts to targets."""
+
+    @pytest.mark.asyncio
+    async def test_sends_one_message_per_target(self, client):
+        """Should send a well-formed transcript message to every target."""
+        client._server = MagicMock()
+        client._server.send = AsyncMock()
+        client.targets = {"hpb1": Target(), "hpb2": Target()}
+
+        await client.send_transcripts([_transcript("spk", 'say "hi"', final=True)])
+
+        frames = [
+            json.loads(call.args[0]) for call in client._server.send.call_args_list
+        ]
+        assert [f["message"]["recipient"]["sessionid"] for f in frames] == [
+            "hpb1",
+            "hpb2",
+        ]
+        assert [f["id"] for f in frames] == ["1", "2"]
+        assert frames[0]["type"] == "message"
+        assert frames[0]["message"]["recipient"]["type"] == "session"
+        assert frames[0]["message"]["data"] == {
+            "final": True,
+            "langId": "en",
+            "message": 'say "hi"',
+            "speakerSessionId": "spk",
+            "type": "transcript",
+        }
+
+    @pytest.mark.asyncio
+    async def test_no_targets(self, client):
+        """Should not send anything without targets."""
+        client._server = MagicMock()
+        client._server.send = AsyncMock()
+
+        await client.send_transcripts([_transcript("spk", "hi", final=True)])
+
+        client._server.send.assert_not_awaited()
+
+
+class TestTranscriptQueueConsumer:
+    """Tests for the transcript queue consumer."""
+
+    @pytest.mark.asyncio
+    async def test_waits_while_inactive(self, client):
+        """Should hold queued transcripts until the client is active again."""
+        client.send_transcripts = AsyncMock()
+        client._active_event.clear()
+        await client.transcript_queue.put(_transcript("spk", "hi", final=True))
+
+        consumer = asyncio.create_task(client.transcript_queue_consumer())
+        try:
+            await asyncio.sleep(0.01)
+            client.send_transcripts.assert_not_awaited()
+
+            client._active_event.set()
+            await asyncio.sleep(0.01)
+            client.send_transcripts.assert_awaited_once()
+        finally:
+            consumer.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await consumer
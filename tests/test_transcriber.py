@@ -12,6 +12,7 @@ from ex_app.lib.transcriber import (
     ModalTranscriber,
     TranscriptionResult,
     TranscriberFactory,
+    pcm16_to_mono_float32,
 )
 
 
@@ -41,6 +42,117 @@ class TestAudioResampler:
         # Should be roughly double the length
         assert len(result) == pytest.approx(4800, rel=0.1)
 
+    def test_chunked_stream_is_continuous(self):
+        """Should resample consecutive frames as one continuous signal."""
+        resampler = AudioResampler(48000, 24000)
+        tone = 0.5 * np.sin(2 * np.pi * 440 * np.arange(48000) / 48000)
+        audio = tone.astype(np.float32)
+        result = np.concatenate(
+            [resampler.resample(audio[i : i + 960]) for i in range(0, 48000, 960)]
+        )
+        expected = 0.5 * np.sin(2 * np.pi * 440 * np.arange(len(result)) / 24000)
+        assert result.dtype == np.float32
+        assert len(result) == pytest.approx(24000, abs=20)
+        # Skip the start-up transient of the zero history
+        np.testing.assert_allclose(result[50:], expected[50:], atol=1e-3)
+
+    def test_int16_output_is_rounded_and_saturated(self):
+        """Should round int16 output and clip overshoot instead of wrapping."""
+        # Full-scale square wave; the filter overshoots at the edges
+        audio = np.tile(
+            np.r_[np.full(48, 32767), np.full(48, -32768)], 10
+        ).astype(np.int16)
+        result = AudioResampler(48000, 24000).resample(audio)
+        reference = AudioResampler(48000, 24000).resample(audio.astype(np.float32))
+        assert result.dtype == np.int16
+        assert np.abs(reference).max() > 32768
+        np.testing.assert_array_equal(
+            result, np.clip(np.round(reference), -32768, 32767)
+        )
+
+    def test_linear_fallback_without_scipy(self):
+        """Should linearly interpolate when scipy is not available."""
+        with patch("ex_app.lib.transcriber.signal", None):
+            resampler = AudioResampler(24000, 48000)
+        audio = np.array([0, 100, 200, 300], dtype=np.int16)
+        result = resampler.resample(audio)
+        assert result.dtype == np.int16
+        np.testing.assert_array_equal(result, [0, 50, 100, 150, 200, 250, 300, 300])
+
+        with patch("ex_app.lib.transcriber.signal", None):
+            resampler = AudioResampler(48000, 32000)
+        audio = np.array([0.0, 0.3, 0.6, 0.9, 1.2, 1.5], dtype=np.float32)
+        result = resampler.resample(audio)
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, [0.0, 0.45, 0.9, 1.35], atol=1e-6)
+
+    def test_linear_fallback_empty_first_frame(self):
+        """Should return an empty array for an empty first frame."""
+        with patch("ex_app.lib.transcriber.signal", None):
+            resampler = AudioResampler(48000, 24000)
+        assert resampler.filt is None
+        result = resampler.resample(np.array([], dtype=np.int16))
+        assert result.dtype == np.int16
+        assert len(result) == 0
+
+    def test_linear_fallback_rebuilds_cache_on_length_change(self):
+        """Should interpolate correctly after an empty frame and across lengths."""
+        with patch("ex_app.lib.transcriber.signal", None):
+            resampler = AudioResampler(24000, 48000)
+        assert resampler.filt is None
+        assert len(resampler.resample(np.array([], dtype=np.int16))) == 0
+
+        result = resampler.resample(np.array([0, 100], dtype=np.int16))
+        np.testing.assert_array_equal(result, [0, 50, 100, 100])
+
+        result = resampler.resample(np.array([0, 100, 200, 300], dtype=np.int16))
+        np.testing.assert_array_equal(result, [0, 50, 100, 150, 200, 250, 300, 300])
+
+        result = resampler.resample(np.array([10, 20], dtype=np.int16))
+        np.testing.assert_array_equal(result, [10, 15, 20, 20])
+
+    def test_reset_clears_history(self):
+        """Should produce the same output for the same input after reset."""
+        resampler = AudioResampler(48000, 24000)
+        audio = np.random.default_rng(0).standard_normal(960).astype(np.float32)
+        first = resampler.resample(audio)
+        resampler.resample(audio)
+        resampler.reset()
+        np.testing.assert_array_equal(resampler.resample(audio), first)
+
+
+class TestPcm16ToMonoFloat32:
+    """Tests for pcm16_to_mono_float32."""
+
+    def test_stereo_is_averaged(self):
+        """Should average interleaved channels and normalize to float32."""
+        stereo = np.array([16384, 0, -32768, -32768, 32767, 32767], dtype=np.int16)
+        result = pcm16_to_mono_float32(stereo.tobytes())
+        assert result.dtype == np.float32
+        expected = stereo.reshape(-1, 2).mean(axis=1) / 32768.0
+        np.testing.assert_allclose(result, expected, atol=1e-6)
+
+    def test_mono_is_only_scaled(self):
+        """Should not average samples of mono audio, whatever its length."""
+        mono = np.array([16384, -16384, 0, 8192], dtype=np.int16)
+        result = pcm16_to_mono_float32(mono.tobytes(), channels=1)
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, [0.5, -0.5, 0.0, 0.25])
+
+    def test_ignores_incomplete_trailing_sample(self):
+        """Should drop a stray trailing byte or channel sample."""
+        stereo = np.array([16384, 16384, -16384], dtype=np.int16)
+        result = pcm16_to_mono_float32(stereo.tobytes() + b"\x01")
+        np.testing.assert_allclose(result, [0.5])
+
+    def test_writes_into_out_buffer(self):
+        """Should write into the given buffer and return a view of it."""
+        out = np.zeros(8, dtype=np.float32)
+        stereo = np.array([16384, 16384, -16384, 0], dtype=np.int16)
+        result = pcm16_to_mono_float32(stereo.tobytes(), out=out)
+        assert np.shares_memory(result, out)
+        np.testing.assert_allclose(result, [0.5, -0.25])
+
 
 class TestTranscriptionResult:
     """Tests for TranscriptionResult dataclass."""
@@ -61,6 +173,13 @@ class TestTranscriptionResult:
         result = TranscriptionResult(text="Hi", is_final=False)
         assert result.is_vad_end is False
 
+    def test_immutable(self):
+        """Should not allow fields to be changed or added."""
+        result = TranscriptionResult(text="Hi", is_final=False)
+        with pytest.raises(AttributeError):
+            result.text = "Bye"
+        assert not hasattr(result, "__dict__")
+
 
 class TestModalTranscriber:
     """Tests for ModalTranscriber class."""
@@ -113,6 +232,18 @@ class TestModalTranscriber:
         assert result.text == " Hello"
         assert result.is_final is False
 
+    def test_parse_binary_message(self):
+        """Should parse messages delivered as binary frames."""
+        transcriber = ModalTranscriber(
+            session_id="test",
+            workspace="ws",
+            modal_key="key",
+            modal_secret="secret",
+        )
+        result = transcriber._parse_result(b'{"type": "token", "text": " Hello"}')
+        assert result is not None
+        assert result.text == " Hello"
+
     def test_parse_vad_end_result(self):
         """Should parse VAD end message."""
         transcriber = ModalTranscriber(
@@ -199,6 +330,22 @@ class TestModalTranscriberAsync:
         with pytest.raises(ModalConnectionError):
             await transcriber.connect()
 
+    @pytest.mark.asyncio
+    async def test_connect_disables_compression(self):
+        """Should not negotiate permessage-deflate for the PCM stream."""
+        transcriber = ModalTranscriber(
+            session_id="test",
+            workspace="ws",
+            modal_key="key",
+            modal_secret="secret",
+        )
+        with patch(
+            "ex_app.lib.transcriber.websockets.connect", new=AsyncMock()
+        ) as connect:
+            await transcriber.connect()
+
+        assert connect.call_args.kwargs["compression"] is None
+
     def test_log_transcript_includes_speaker(self, caplog):
         """Should log speaker context with transcript."""
         transcriber = ModalTranscriber(
@@ -213,6 +360,24 @@ class TestModalTranscriberAsync:
             "[speaker=speaker123]" in record.message for record in caplog.records
         )
 
+    def test_tokens_logged_on_flush(self, caplog):
+        """Should accumulate tokens and log them together on flush."""
+        transcriber = ModalTranscriber(
+            session_id="speaker123",
+            workspace="ws",
+            modal_key="key",
+            modal_secret="secret",
+        )
+        with caplog.at_level(logging.INFO):
+            transcriber._parse_result('{"type": "token", "text": "hello"}')
+            transcriber._parse_result('{"type": "token", "text": " world"}')
+            assert not any("TRANSCRIPT" in r.message for r in caplog.records)
+            transcriber._flush_transcript_log()
+        assert [r.message for r in caplog.records if "TRANSCRIPT" in r.message] == [
+            "[speaker=speaker123] >>> TRANSCRIPT: hello world"
+        ]
+        assert transcriber._transcript_buffer.getvalue() == ""
+
     @pytest.mark.asyncio
     async def test_flush_buffer_stops_on_connection_closed(self):
         """Should stop transcriber when Modal closes during send."""
@@ -227,8 +392,7 @@ class TestModalTranscriberAsync:
             side_effect=Exception("placeholder")
         )
         transcriber._running = True
-        transcriber._audio_buffer = [np.zeros(100, dtype=np.int16)]
-        transcriber._buffer_duration_ms = transcriber._min_buffer_ms
+        transcriber._write_pos = 100
 
         # Simulate websockets connection closed during send
         from websockets.frames import Close
@@ -243,7 +407,231 @@ class TestModalTranscriberAsync:
 
         assert transcriber._running is False
         assert transcriber._ws is None
-        assert transcriber._audio_buffer == []
+        assert transcriber._write_pos == 0
+
+    @pytest.mark.asyncio
+    async def test_buffered_frames_sent_as_float32(self):
+        """Should send buffered frames in one message once enough is buffered."""
+        transcriber = ModalTranscriber(
+            session_id="sess123",
+            workspace="ws",
+            modal_key="key",
+            modal_secret="secret",
+        )
+        sent: list[bytes] = []
+        transcriber._ws = MagicMock()
+        transcriber._ws.send = AsyncMock(side_effect=lambda data: sent.append(bytes(data)))
+        transcriber._ws.transport.get_write_buffer_size.return_value = 0
+
+        # 20ms stereo frames at 48kHz, resampled 100ms at a time; 200ms of
+        # audio triggers a send (the resampler holds back a few samples, so
+        # it takes one extra batch)
+        frame = np.full(960 * 2, 16384, dtype=np.int16).tobytes()
+        for _ in range(14):
+            await transcriber._process_and_send_audio(frame)
+        assert sent == []
+
+        await transcriber._process_and_send_audio(frame)
+
+        assert len(sent) == 1
+        samples = np.frombuffer(sent[0], dtype=np.float32)
+        assert len(samples) >= transcriber._min_buffer_ms * 24
+        np.testing.assert_allclose(samples[100:], 0.5, atol=1e-3)
+        assert transcriber._write_pos == 0
+
+    @pytest.mark.asyncio
+    async def test_keeps_buffering_while_transport_congested(self):
+        """Should hold audio back while earlier sends are still queued."""
+        transcriber = ModalTranscriber(
+            session_id="sess123",
+            workspace="ws",
+            modal_key="key",
+            modal_secret="secret",
+        )
+        transcriber._ws = MagicMock()
+        transcriber._ws.send = AsyncMock()
+        transcriber._ws.transport.get_write_buffer_size.return_value = 4096
+
+        frame = np.zeros(960 * 2, dtype=np.int16).tobytes()
+        for _ in range(20):
+            await transcriber._process_and_send_audio(frame)
+        transcriber._ws.send.assert_not_awaited()
+
+        transcriber._ws.transport.get_write_buffer_size.return_value = 0
+        for _ in range(5):
+            await transcriber._process_and_send_audio(frame)
+        transcriber._ws.send.assert_awaited_once()
+        assert transcriber._write_pos == 0
+
+    @pytest.mark.asyncio
+    async def test_frames_resampled_in_batches(self):
+        """Should hold frames back until a full batch is ready to resample."""
+        transcriber = ModalTranscriber(
+            session_id="sess123",
+            workspace="ws",
+            modal_key="key",
+            modal_secret="secret",
+        )
+        transcriber._ws = MagicMock()
+        transcriber._ws.send = AsyncMock()
+        frame = np.zeros(960 * 2, dtype=np.int16).tobytes()
+
+        for _ in range(4):
+            await transcriber._process_and_send_audio(frame)
+        assert transcriber._input_pos == 960 * 4
+        assert transcriber._write_pos == 0
+
+        await transcriber._process_and_send_audio(frame)
+        assert transcriber._input_pos == 0
+        assert transcriber._write_pos > 0
+
+    @pytest.mark.asyncio
+    async def test_pending_input_buffered_on_demand(self):
+        """Should resample a partial batch so it can be flushed at stream end."""
+        transcriber = ModalTranscriber(
+            session_id="sess123",
+            workspace="ws",
+            modal_key="key",
+            modal_secret="secret",
+        )
+        transcriber._ws = MagicMock()
+        transcriber._ws.send = AsyncMock()
+        frame = np.zeros(960 * 2, dtype=np.int16).tobytes()
+        await transcriber._process_and_send_audio(frame)
+
+        await transcriber._buffer_pending_input()
+
+        assert transcriber._input_pos == 0
+        assert transcriber._write_pos > 0
+
+    @pytest.mark.asyncio
+    async def test_flush_sends_view_of_buffer(self):
+        """Should send a byte view of the buffer rather than a copy."""
+        transcriber = ModalTranscriber(
+            session_id="sess123",
+            workspace="ws",
+            modal_key="key",
+            modal_secret="secret",
+        )
+        transcriber._ws = MagicMock()
+        transcriber._ws.send = AsyncMock()
+        transcriber._ring[:4] = [0.5, -0.5, 0.25, 1.0]
+        transcriber._write_pos = 4
+
+        await transcriber._flush_buffer()
+
+        payload = transcriber._ws.send.await_args.args[0]
+        assert isinstance(payload, memoryview)
+        assert payload.format == "B"
+        assert payload.nbytes == 16
+        assert np.shares_memory(np.frombuffer(payload, dtype=np.float32), transcriber._ring)
+
+    @pytest.mark.asyncio
+    async def test_debug_audio_written_to_open_file(self, tmp_path, monkeypatch):
+        """Should append every frame to the capture file and close it on stop."""
+        monkeypatch.setenv("KEEP_DEBUG_AUDIO", "1")
+        transcriber = ModalTranscriber(
+            session_id="sess123",
+            workspace="ws",
+            modal_key="key",
+            modal_secret="secret",
+        )
+        transcriber._ws = MagicMock()
+        transcriber._ws.send = AsyncMock()
+        transcriber._ws.close = AsyncMock()
+        transcriber._debug_audio_dir = tmp_path
+        debug_file = open(tmp_path / "audio_raw.pcm", "ab")
+        transcriber._debug_audio_file = debug_file
+
+        frame = np.arange(1920, dtype=np.int16).tobytes()
+        await transcriber._process_and_send_audio(frame)
+        await transcriber._process_and_send_audio(frame)
+        await transcriber.stop()
+
+        assert debug_file.closed
+        assert transcriber._debug_audio_file is None
+        assert (tmp_path / "audio_raw.pcm").read_bytes() == frame * 2
+
+    @pytest.mark.asyncio
+    async def test_stale_check_runs_at_most_once_per_second(self):
+        """Should skip stale checks within a second of the previous one."""
+        transcriber = ModalTranscriber(
+            session_id="sess123",
+            workspace="ws",
+            modal_key="key",
+            modal_secret="secret",
+        )
+        transcriber._first_audio_sent_time = 1.0
+        transcriber._last_audio_sent_time = 1000.0
+
+        with patch("ex_app.lib.transcriber.time.time", return_value=999.5):
+            await transcriber._check_stale_connection()
+        assert transcriber._stale_warned is True
+
+        transcriber._stale_warned = False
+        with patch("ex_app.lib.transcriber.time.time", return_value=1000.0):
+            await transcriber._check_stale_connection()
+        assert transcriber._stale_warned is False
+
+        with patch("ex_app.lib.transcriber.time.time", return_value=1000.5):
+            await transcriber._check_stale_connection()
+        assert transcriber._stale_warned is True
+
+    @pytest.mark.asyncio
+    async def test_get_results_ends_when_stopped(self):
+        """Should yield queued results and return as soon as it stops."""
+        transcriber = ModalTranscriber(
+            session_id="sess123",
+            workspace="ws",
+            modal_key="key",
+            modal_secret="secret",
+        )
+        transcriber._running = True
+        results = []
+
+        async def consume():
+            async for result in transcriber.get_results():
+                results.append(result)
+
+        consumer = asyncio.create_task(consume())
+        await transcriber._result_queue.put(TranscriptionResult("hi", False))
+        await asyncio.sleep(0)
+        transcriber._running = False
+
+        await asyncio.wait_for(consumer, timeout=0.5)
+        assert [r.text for r in results] == ["hi"]
+
+    @pytest.mark.asyncio
+    async def test_receive_loop_reads_undecoded_frames(self):
+        """Should receive frames as bytes and queue the parsed results."""
+        from websockets.exceptions import ConnectionClosedOK
+        from websockets.frames import Close
+
+        transcriber = ModalTranscriber(
+            session_id="sess123",
+            workspace="ws",
+            modal_key="key",
+            modal_secret="secret",
+        )
+        close_frame = Close(1000, "OK")
+        ws = transcriber._ws = MagicMock()
+        ws.recv = AsyncMock(
+            side_effect=[
+                b'{"type": "token", "text": " Hello"}',
+                b'{"type": "ping"}',
+                ConnectionClosedOK(
+                    rcvd=close_frame, sent=close_frame, rcvd_then_sent=True
+                ),
+            ]
+        )
+        transcriber._running = True
+
+        await transcriber._receive_results_loop()
+
+        ws.recv.assert_awaited_with(decode=False)
+        assert transcriber._result_queue.get_nowait().text == " Hello"
+        assert transcriber._result_queue.empty()
+        assert transcriber._running is False
 
     @pytest.mark.asyncio
     async def test_stop_when_not_running(self):
@@ -0,0 +1,31 @@
+"""Tests for utils module."""
+
+from ex_app.lib.utils import sanitize_websocket_url
+
+
+class TestSanitizeWebsocketUrl:
+    """Tests for sanitize_websocket_url."""
+
+    def test_http_schemes_converted(self):
+        """Should map http/https to ws/wss."""
+        assert sanitize_websocket_url("http://hpb.local") == "ws://hpb.local/spreed"
+        assert sanitize_websocket_url("https://hpb.local") == "wss://hpb.local/spreed"
+
+    def test_ws_schemes_kept(self):
+        """Should leave ws/wss URLs untouched apart from the path."""
+        assert sanitize_websocket_url("wss://hpb.local/") == "wss://hpb.local/spreed"
+        assert sanitize_websocket_url("ws://hpb.local/spreed") == "ws://hpb.local/spreed"
+
+    def test_existing_spreed_path_kept(self):
+        """Should not append /spreed twice."""
+        assert (
+            sanitize_websocket_url("https://hpb.local/standalone-signaling/spreed/")
+            == "wss://hpb.local/standalone-signaling/spreed/"
+        )
+
+    def test_scheme_only_replaced_at_start(self):
+        """Should not rewrite http:// appearing later in the URL."""
+        assert (
+            sanitize_websocket_url("wss://hpb.local/http://x")
+            == "wss://hpb.local/http://x/spreed"
+        )